@@ -133,9 +133,13 @@ class ColumnExtractor(BaseExtractor):
         # Extract x-center positions
         x_centers = np.array([(b['x0'] + b['x1']) / 2 for b in blocks]).reshape(-1, 1)
 
-        # Cluster by x-position
+        # Cluster by x-position (a single k-means++ start suffices for 1-D
+        # x-centres with well-separated columns)
         try:
-            kmeans = KMeans(n_clusters=num_columns, random_state=42, n_init=10)
+            kmeans = KMeans(
+                n_clusters=num_columns, random_state=42,
+                n_init=1, algorithm='lloyd', max_iter=50
+            )
             cluster_labels = kmeans.fit_predict(x_centers)
 
             # Get cluster centers and sort them left to right
@@ -295,7 +299,10 @@ class ColumnExtractor(BaseExtractor):
                 continue
 
             try:
-                kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
+                kmeans = KMeans(
+                    n_clusters=k, random_state=42,
+                    n_init=1, algorithm='lloyd', max_iter=50
+                )
                 kmeans.fit(x_centers.reshape(-1, 1))
                 score = kmeans.inertia_  # Within-cluster sum of squares
 
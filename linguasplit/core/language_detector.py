@@ -3,7 +3,9 @@ Language detection module with multi-strategy approach.
 Supports flexible, extensible language detection for any language.
 """
 
+import os
 import re
+import threading
 from typing import Tuple, Dict, List, Optional
 
 
@@ -15,12 +17,54 @@ class LanguageDetector:
     to identify languages with high accuracy.
     """
 
-    def __init__(self, custom_patterns: Optional[Dict] = None):
+    # ISO 639-1 code -> language name
+    ISO_NAMES = {
+        'en': 'english',
+        'fr': 'french',
+        'es': 'spanish',
+        'de': 'german',
+        'it': 'italian',
+        'pt': 'portuguese',
+        'ru': 'russian',
+        'ar': 'arabic',
+        'zh': 'chinese',
+        'ja': 'japanese',
+        'ko': 'korean',
+        'hi': 'hindi',
+        'rw': 'kinyarwanda',
+        'sw': 'swahili',
+        'nl': 'dutch',
+        'pl': 'polish',
+        'tr': 'turkish',
+        'vi': 'vietnamese',
+        'th': 'thai',
+        'el': 'greek'
+    }
+
+    # langdetect profiles a language is recognized through besides its own
+    # (langdetect has no Kinyarwanda profile and reports it as Swahili;
+    # French misdetected as Catalan is corrected in _detect_with_langdetect)
+    PROXY_PROFILES = {
+        'kinyarwanda': ('sw',),
+        'french': ('ca',),
+    }
+
+    # Restricted langdetect factories shared by all instances, keyed by profile set
+    _factories: Dict[frozenset, object] = {}
+    _factories_lock = threading.Lock()
+
+    def __init__(
+        self,
+        custom_patterns: Optional[Dict] = None,
+        restrict_to: Optional[List[str]] = None
+    ):
         """
         Initialize language detector.
 
         Args:
             custom_patterns: Optional dictionary of custom language keyword patterns
+            restrict_to: Optional language names to limit statistical detection to;
+                only the matching langdetect profiles are loaded
         """
         # Try to import langdetect
         self.langdetect_available = True
@@ -31,6 +75,11 @@ class LanguageDetector:
         except ImportError:
             self.langdetect_available = False
 
+        if self.langdetect_available and restrict_to:
+            factory = self._get_restricted_factory(restrict_to)
+            if factory is not None:
+                self.detect_langs = lambda text: self._detect_langs_with(factory, text)
+
         # Default keyword patterns for common languages
         self.keyword_patterns = {
             'kinyarwanda': {
@@ -99,6 +148,75 @@ class LanguageDetector:
 
         return ('unknown', 0.0)
 
+    def detect_batch(self, texts: List[str], min_length: int = 100) -> List[Tuple[str, float]]:
+        """
+        Detect language for many texts in one call.
+
+        Args:
+            texts: Texts to analyze
+            min_length: Minimum text length for reliable detection
+
+        Returns:
+            List of (language_name, confidence_score) tuples, one per text
+        """
+        return [self.detect_language(text, min_length) for text in texts]
+
+    @classmethod
+    def _get_restricted_factory(cls, languages: List[str]):
+        """
+        Get a langdetect factory holding only the profiles for given languages.
+
+        Args:
+            languages: Language names (or ISO 639-1 codes)
+
+        Returns:
+            DetectorFactory instance, or None if fewer than two profiles match
+        """
+        from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+
+        name_to_code = {name: code for code, name in cls.ISO_NAMES.items()}
+        codes = set()
+        for language in languages:
+            language = language.strip().lower()
+            codes.add(name_to_code.get(language, language))
+            codes.update(cls.PROXY_PROFILES.get(language, ()))
+
+        # Keep only languages langdetect ships a profile for
+        codes = frozenset(
+            code for code in codes
+            if os.path.isfile(os.path.join(PROFILES_DIRECTORY, code))
+        )
+        if len(codes) < 2:
+            return None
+
+        with cls._factories_lock:
+            factory = cls._factories.get(codes)
+            if factory is None:
+                profiles = []
+                for code in sorted(codes):
+                    with open(os.path.join(PROFILES_DIRECTORY, code), 'r', encoding='utf-8') as f:
+                        profiles.append(f.read())
+                factory = DetectorFactory()
+                factory.load_json_profile(profiles)
+                cls._factories[codes] = factory
+        return factory
+
+    @staticmethod
+    def _detect_langs_with(factory, text: str):
+        """
+        Run langdetect's detect_langs against a specific factory.
+
+        Args:
+            factory: Loaded DetectorFactory
+            text: Text to analyze
+
+        Returns:
+            List of langdetect Language results, most probable first
+        """
+        detector = factory.create()
+        detector.append(text)
+        return detector.get_probabilities()
+
     def _detect_with_langdetect(self, text: str) -> Optional[Tuple[str, float]]:
         """
         Detect language using langdetect library.
@@ -267,29 +385,7 @@ class LanguageDetector:
         Returns:
             Full language name
         """
-        iso_map = {
-            'en': 'english',
-            'fr': 'french',
-            'es': 'spanish',
-            'de': 'german',
-            'it': 'italian',
-            'pt': 'portuguese',
-            'ru': 'russian',
-            'ar': 'arabic',
-            'zh': 'chinese',
-            'ja': 'japanese',
-            'ko': 'korean',
-            'hi': 'hindi',
-            'rw': 'kinyarwanda',
-            'sw': 'swahili',
-            'nl': 'dutch',
-            'pl': 'polish',
-            'tr': 'turkish',
-            'vi': 'vietnamese',
-            'th': 'thai',
-            'el': 'greek'
-        }
-        return iso_map.get(iso_code, iso_code)
+        return self.ISO_NAMES.get(iso_code, iso_code)
 
     def add_custom_pattern(self, language: str, keywords: List[str], weight: float = 1.0):
         """
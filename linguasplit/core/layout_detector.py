@@ -6,7 +6,96 @@ Detects columns, sequential paragraphs, and section blocks using spatial and lan
 import fitz  # PyMuPDF
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
-from collections import defaultdict
+from collections import namedtuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Script ids used by the BMP lookup tables below
+_SCRIPT_OTHER, _SCRIPT_LATIN, _SCRIPT_LATIN_EXT, _SCRIPT_CYRILLIC, _SCRIPT_ARABIC, _SCRIPT_CJK = range(6)
+_NUM_SCRIPTS = 6
+_BMP_MAX = 0xFFFF
+
+
+def _build_script_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build codepoint -> script id and codepoint -> is-alpha tables for the BMP.
+
+    Returns:
+        Tuple of (script table, alpha table), both indexed by codepoint
+    """
+    script_tbl = np.zeros(_BMP_MAX + 1, dtype=np.uint8)
+    script_tbl[0x0000:0x0080] = _SCRIPT_LATIN
+    script_tbl[0x0080:0x0250] = _SCRIPT_LATIN_EXT
+    script_tbl[0x0400:0x0500] = _SCRIPT_CYRILLIC
+    script_tbl[0x0600:0x0700] = _SCRIPT_ARABIC
+    script_tbl[0x4E00:0xA000] = _SCRIPT_CJK
+
+    alpha_tbl = np.fromiter(
+        (chr(cp).isalpha() for cp in range(_BMP_MAX + 1)),
+        dtype=np.bool_,
+        count=_BMP_MAX + 1
+    )
+
+    return script_tbl, alpha_tbl
+
+
+SCRIPT_TBL, ALPHA_TBL = _build_script_tables()
+
+
+def _welford_gap_stats(y_sorted: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and population variance of consecutive gaps in one streaming pass.
+
+    Args:
+        y_sorted: Sorted positions
+
+    Returns:
+        Tuple of (mean gap, gap variance); (0.0, 0.0) with fewer than two positions
+    """
+    n = len(y_sorted) - 1
+    if n <= 0:
+        return 0.0, 0.0
+
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        gap = y_sorted[i + 1] - y_sorted[i]
+        delta = gap - mean
+        mean += delta / (i + 1)
+        m2 += delta * (gap - mean)
+
+    return mean, m2 / n
+
+
+def _numpy_gap_stats(y_sorted: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and population variance of consecutive gaps via np.diff.
+
+    Args:
+        y_sorted: Sorted positions
+
+    Returns:
+        Tuple of (mean gap, gap variance); (0.0, 0.0) with fewer than two positions
+    """
+    if len(y_sorted) < 2:
+        return 0.0, 0.0
+
+    gaps = np.diff(y_sorted)
+    return float(np.mean(gaps)), float(np.var(gaps))
+
+
+# The streaming pass only beats np.diff + np.var when compiled
+_gap_stats = njit(cache=True)(_welford_gap_stats) if NUMBA_AVAILABLE else _numpy_gap_stats
+
+
+# Per-block columns gathered in one pass over pages_data (structure of arrays).
+# Coordinates are float32: 72 DPI page points need nothing wider.
+BlockArrays = namedtuple('BlockArrays', ['x0', 'y0', 'x1', 'widths', 'texts', 'page_ids'])
 
 
 class LayoutDetector:
@@ -29,6 +118,13 @@ class LayoutDetector:
     SPATIAL_THRESHOLD = 0.6  # Threshold for spatial score
     LANGUAGE_THRESHOLD = 0.5  # Threshold for language pattern score
     MIN_BLOCKS_FOR_ANALYSIS = 10  # Minimum text blocks needed
+    LANGUAGE_BUCKET_WIDTH = 50  # X-bucket width in points for per-column language stats
+    EARLY_EXIT_BLOCK_FACTOR = 4  # Stop sampling after this many multiples of MIN_BLOCKS_FOR_ANALYSIS
+
+    # Labels returned by _simple_language_detect, indexed by language id
+    LANGUAGE_LABELS = ('unknown', 'latin', 'cyrillic', 'arabic', 'cjk', 'mixed')
+    _LANGUAGE_IDS = {label: i for i, label in enumerate(LANGUAGE_LABELS)}
+    _UNKNOWN_ID = 0
 
     def __init__(self, min_column_gap: int = None, spatial_threshold: float = None):
         """
@@ -41,12 +137,15 @@ class LayoutDetector:
         self.min_column_gap = min_column_gap or self.COLUMN_MIN_GAP
         self.spatial_threshold = spatial_threshold or self.SPATIAL_THRESHOLD
 
-    def detect_layout(self, pdf_path: str) -> Dict[str, Any]:
+    def detect_layout(self, pdf_path: str,
+                      page_cache: Optional[Dict[int, Dict]] = None) -> Dict[str, Any]:
         """
         Main detection method to analyze PDF layout.
 
         Args:
             pdf_path: Path to PDF file
+            page_cache: Optional dict filled with page index -> get_text("dict")
+                output for every page read, so callers can reuse it
 
         Returns:
             Dictionary with keys:
@@ -57,8 +156,12 @@ class LayoutDetector:
                 - language_score: Language pattern score
         """
         try:
-            # Extract page data from PDF
-            pages_data = self._extract_pages_data(pdf_path)
+            # Extract page data from PDF (a representative prefix is enough)
+            pages_data = self._extract_pages_data(
+                pdf_path,
+                early_exit_threshold=self.MIN_BLOCKS_FOR_ANALYSIS * self.EARLY_EXIT_BLOCK_FACTOR,
+                page_cache=page_cache
+            )
 
             if not pages_data:
                 return {
@@ -69,11 +172,14 @@ class LayoutDetector:
                     'language_score': 0.0
                 }
 
+            # Collect block coordinates and text once for both analyzers
+            block_arrays = self._collect_block_arrays(pages_data)
+
             # Analyze spatial distribution
-            spatial_result = self.analyze_spatial_distribution(pages_data)
+            spatial_result = self.analyze_spatial_distribution(pages_data, block_arrays)
 
             # Analyze language patterns
-            language_result = self.analyze_language_patterns(pages_data)
+            language_result = self.analyze_language_patterns(pages_data, block_arrays)
 
             # Classify layout based on combined analysis
             layout_type, confidence, details = self.classify_layout(
@@ -98,50 +204,63 @@ class LayoutDetector:
                 'language_score': 0.0
             }
 
-    def _extract_pages_data(self, pdf_path: str) -> List[Dict]:
+    def _extract_pages_data(self, pdf_path: str,
+                            early_exit_threshold: Optional[int] = None,
+                            page_cache: Optional[Dict[int, Dict]] = None) -> List[Dict]:
         """
         Extract text block data from PDF pages.
 
         Args:
             pdf_path: Path to PDF file
+            early_exit_threshold: Stop after the page on which this many text
+                blocks have been collected (None extracts every page)
+            page_cache: Optional dict to store each page's get_text("dict")
+                output in, keyed by page index
 
         Returns:
             List of page data dictionaries
         """
         pages_data = []
+        total_blocks = 0
 
         try:
-            doc = fitz.open(pdf_path)
-
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                blocks = page.get_text("dict")["blocks"]
-
-                page_data = {
-                    'page_num': page_num,
-                    'width': page.rect.width,
-                    'height': page.rect.height,
-                    'blocks': []
-                }
-
-                for block in blocks:
-                    if block.get('type') == 0:  # Text block
-                        block_data = {
-                            'x0': block['bbox'][0],
-                            'y0': block['bbox'][1],
-                            'x1': block['bbox'][2],
-                            'y1': block['bbox'][3],
-                            'text': self._extract_block_text(block),
-                            'lines': len(block.get('lines', []))
-                        }
-
-                        if block_data['text'].strip():
-                            page_data['blocks'].append(block_data)
-
-                if page_data['blocks']:
-                    pages_data.append(page_data)
-
-            doc.close()
+            with fitz.open(pdf_path) as doc:
+                for page_num in range(len(doc)):
+                    page = doc[page_num]
+                    page_dict = page.get_text("dict")
+                    if page_cache is not None:
+                        page_cache[page_num] = page_dict
+                    blocks = page_dict["blocks"]
+
+                    page_data = {
+                        'page_num': page_num,
+                        'width': page.rect.width,
+                        'height': page.rect.height,
+                        'blocks': []
+                    }
+
+                    for block in blocks:
+                        if block.get('type') == 0:  # Text block
+                            text = self._extract_block_text(block)
+
+                            # isspace() checks without allocating a stripped copy
+                            if text and not text.isspace():
+                                page_data['blocks'].append({
+                                    'x0': block['bbox'][0],
+                                    'y0': block['bbox'][1],
+                                    'x1': block['bbox'][2],
+                                    'y1': block['bbox'][3],
+                                    'text': text,
+                                    'lines': len(block.get('lines', []))
+                                })
+
+                    if page_data['blocks']:
+                        pages_data.append(page_data)
+                        total_blocks += len(page_data['blocks'])
+
+                    # Enough blocks for stable statistics - skip remaining pages
+                    if early_exit_threshold is not None and total_blocks >= early_exit_threshold:
+                        break
 
         except Exception as e:
             raise Exception(f"Failed to extract PDF data: {str(e)}")
@@ -166,12 +285,47 @@ class LayoutDetector:
 
         return ' '.join(text_parts)
 
-    def analyze_spatial_distribution(self, pages_data: List[Dict]) -> Dict[str, Any]:
+    def _collect_block_arrays(self, pages_data: List[Dict]) -> BlockArrays:
+        """
+        Gather per-block coordinates and text in a single pass.
+
+        Args:
+            pages_data: List of page data dictionaries
+
+        Returns:
+            BlockArrays with NumPy coordinate arrays and a list of texts
+        """
+        x0, y0, x1, texts, page_ids = [], [], [], [], []
+
+        for page_data in pages_data:
+            page_num = page_data['page_num']
+            for block in page_data['blocks']:
+                x0.append(block['x0'])
+                y0.append(block['y0'])
+                x1.append(block['x1'])
+                texts.append(block['text'])
+                page_ids.append(page_num)
+
+        x0 = np.asarray(x0, dtype=np.float32)
+        x1 = np.asarray(x1, dtype=np.float32)
+
+        return BlockArrays(
+            x0=x0,
+            y0=np.asarray(y0, dtype=np.float32),
+            x1=x1,
+            widths=x1 - x0,
+            texts=texts,
+            page_ids=np.asarray(page_ids, dtype=np.int32)
+        )
+
+    def analyze_spatial_distribution(self, pages_data: List[Dict],
+                                     block_arrays: Optional[BlockArrays] = None) -> Dict[str, Any]:
         """
         Analyze spatial distribution of text blocks.
 
         Args:
             pages_data: List of page data dictionaries
+            block_arrays: Precollected block arrays (collected from pages_data if None)
 
         Returns:
             Dictionary with spatial analysis results:
@@ -183,26 +337,18 @@ class LayoutDetector:
         if not pages_data:
             return {'score': 0.0, 'column_count': 1, 'column_positions': [], 'y_distribution': {}}
 
-        # Collect all x-positions (left edges of blocks)
-        all_x_positions = []
-        all_y_positions = []
-        block_widths = []
+        if block_arrays is None:
+            block_arrays = self._collect_block_arrays(pages_data)
 
-        for page_data in pages_data:
-            for block in page_data['blocks']:
-                all_x_positions.append(block['x0'])
-                all_y_positions.append(block['y0'])
-                block_widths.append(block['x1'] - block['x0'])
-
-        if not all_x_positions:
+        if len(block_arrays.x0) == 0:
             return {'score': 0.0, 'column_count': 1, 'column_positions': [], 'y_distribution': {}}
 
-        # Cluster x-positions to detect columns
-        column_positions = self.cluster_positions(all_x_positions, self.min_column_gap)
+        # Cluster x-positions (left edges of blocks) to detect columns
+        column_positions = self.cluster_positions(block_arrays.x0, self.min_column_gap)
         column_count = len(column_positions)
 
         # Analyze y-distribution for sequential vs. sectioned layout
-        y_distribution = self._analyze_y_distribution(all_y_positions)
+        y_distribution = self._analyze_y_distribution(block_arrays.y0)
 
         # Calculate spatial score
         # High score indicates strong column structure
@@ -211,7 +357,7 @@ class LayoutDetector:
         if column_count > 1:
             # Multi-column layout
             # Check consistency of column usage
-            column_consistency = self._calculate_column_consistency(pages_data, column_positions)
+            column_consistency = self._calculate_column_consistency(block_arrays.x0, column_positions)
             spatial_score = column_consistency * 0.9  # High score for columns
         else:
             # Single column - check for regular spacing
@@ -221,11 +367,11 @@ class LayoutDetector:
                 spatial_score = 0.2  # Low score, likely sections
 
         return {
-            'score': spatial_score,
+            'score': float(spatial_score),
             'column_count': column_count,
             'column_positions': column_positions,
             'y_distribution': y_distribution,
-            'avg_block_width': np.mean(block_widths) if block_widths else 0
+            'avg_block_width': float(np.mean(block_arrays.widths))
         }
 
     def cluster_positions(self, positions: List[float], min_gap: float) -> List[float]:
@@ -239,29 +385,20 @@ class LayoutDetector:
         Returns:
             List of cluster center positions
         """
-        if not positions:
+        if len(positions) == 0:
             return []
 
         # Sort positions
-        sorted_positions = sorted(positions)
-
-        # Simple clustering based on gaps
-        clusters = []
-        current_cluster = [sorted_positions[0]]
-
-        for pos in sorted_positions[1:]:
-            if pos - current_cluster[-1] < min_gap:
-                current_cluster.append(pos)
-            else:
-                # New cluster
-                clusters.append(current_cluster)
-                current_cluster = [pos]
+        sorted_positions = np.sort(np.asarray(positions))
 
-        # Add last cluster
-        clusters.append(current_cluster)
+        # Simple clustering based on gaps: a new cluster starts wherever
+        # the gap to the previous position reaches min_gap
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_positions) >= min_gap) + 1))
+        sizes = np.diff(np.append(starts, len(sorted_positions)))
 
         # Calculate cluster centers
-        cluster_centers = [np.mean(cluster) for cluster in clusters]
+        sums = np.add.reduceat(sorted_positions, starts, dtype=np.float64)
+        cluster_centers = (sums / sizes).tolist()
 
         return cluster_centers
 
@@ -275,17 +412,14 @@ class LayoutDetector:
         Returns:
             Dictionary with y-distribution analysis
         """
-        if not y_positions:
+        if len(y_positions) == 0:
             return {'is_regular': False, 'avg_gap': 0, 'gap_variance': 0}
 
-        sorted_y = sorted(y_positions)
-        gaps = [sorted_y[i+1] - sorted_y[i] for i in range(len(sorted_y) - 1)]
-
-        if not gaps:
+        if len(y_positions) < 2:
             return {'is_regular': False, 'avg_gap': 0, 'gap_variance': 0}
 
-        avg_gap = np.mean(gaps)
-        gap_variance = np.var(gaps)
+        avg_gap, gap_variance = _gap_stats(np.sort(np.asarray(y_positions)))
+        avg_gap, gap_variance = float(avg_gap), float(gap_variance)
 
         # Regular spacing indicates sequential layout
         # High variance indicates sections with breaks
@@ -297,13 +431,13 @@ class LayoutDetector:
             'gap_variance': gap_variance
         }
 
-    def _calculate_column_consistency(self, pages_data: List[Dict],
+    def _calculate_column_consistency(self, x_positions: np.ndarray,
                                      column_positions: List[float]) -> float:
         """
         Calculate how consistently columns are used across pages.
 
         Args:
-            pages_data: List of page data
+            x_positions: Left edges of all text blocks
             column_positions: Detected column x-positions
 
         Returns:
@@ -316,41 +450,37 @@ class LayoutDetector:
         tolerance = self.min_column_gap / 2
 
         # Count blocks in each column across all pages
-        column_usage = defaultdict(int)
-        total_blocks = 0
-
-        for page_data in pages_data:
-            for block in page_data['blocks']:
-                total_blocks += 1
-                # Find which column this block belongs to
-                for i, col_pos in enumerate(column_positions):
-                    if abs(block['x0'] - col_pos) < tolerance:
-                        column_usage[i] += 1
-                        break
-
+        total_blocks = len(x_positions)
         if total_blocks == 0:
             return 0.0
 
-        # Calculate balance across columns
-        usage_values = list(column_usage.values())
-        if not usage_values:
+        # Each block belongs to the first column within tolerance of its left edge
+        within = np.abs(x_positions[:, None] - np.asarray(column_positions)[None, :]) < tolerance
+        matched = within.any(axis=1)
+        column_usage = np.bincount(within[matched].argmax(axis=1), minlength=len(column_positions))
+
+        # Calculate balance across used columns
+        usage_values = column_usage[column_usage > 0]
+        if len(usage_values) == 0:
             return 0.0
 
         # Ideal would be equal distribution
         expected_per_column = total_blocks / len(column_positions)
-        variance = np.var([usage - expected_per_column for usage in usage_values])
+        variance = float(np.var(usage_values - expected_per_column))
 
         # Normalize variance to 0-1 score (lower variance = higher score)
         consistency = 1.0 / (1.0 + variance / expected_per_column) if expected_per_column > 0 else 0.0
 
         return consistency
 
-    def analyze_language_patterns(self, pages_data: List[Dict]) -> Dict[str, Any]:
+    def analyze_language_patterns(self, pages_data: List[Dict],
+                                  block_arrays: Optional[BlockArrays] = None) -> Dict[str, Any]:
         """
         Analyze language mixing patterns in text blocks.
 
         Args:
             pages_data: List of page data dictionaries
+            block_arrays: Precollected block arrays (collected from pages_data if None)
 
         Returns:
             Dictionary with language pattern analysis:
@@ -361,25 +491,17 @@ class LayoutDetector:
         if not pages_data:
             return {'score': 0.0, 'pattern_type': 'unknown', 'language_switches': 0}
 
-        # Collect text blocks with their positions
-        blocks_info = []
-        for page_data in pages_data:
-            for block in page_data['blocks']:
-                blocks_info.append({
-                    'text': block['text'],
-                    'x0': block['x0'],
-                    'y0': block['y0'],
-                    'page': page_data['page_num']
-                })
-
-        if len(blocks_info) < self.MIN_BLOCKS_FOR_ANALYSIS:
+        if block_arrays is None:
+            block_arrays = self._collect_block_arrays(pages_data)
+
+        if len(block_arrays.texts) < self.MIN_BLOCKS_FOR_ANALYSIS:
             return {'score': 0.0, 'pattern_type': 'insufficient_data', 'language_switches': 0}
 
         # Detect language for each block
-        language_blocks = self._detect_block_languages(blocks_info)
+        languages = self._detect_block_languages(block_arrays.texts)
 
         # Analyze patterns
-        pattern_analysis = self._analyze_language_switching_pattern(language_blocks)
+        pattern_analysis = self._analyze_language_switching_pattern(languages, block_arrays.x0)
 
         # Calculate score based on pattern clarity
         score = pattern_analysis['confidence']
@@ -391,33 +513,19 @@ class LayoutDetector:
             'details': pattern_analysis
         }
 
-    def _detect_block_languages(self, blocks_info: List[Dict]) -> List[Dict]:
+    def _detect_block_languages(self, texts: List[str]) -> List[str]:
         """
         Detect language for each text block using simple heuristics.
 
         Args:
-            blocks_info: List of block information dictionaries
+            texts: Text of each block
 
         Returns:
-            List of blocks with language information
+            Detected language for each block, in the same order
         """
         # Simple language detection based on character patterns
         # This is a basic implementation - can be enhanced with langdetect
-
-        language_blocks = []
-
-        for block in blocks_info:
-            text = block['text']
-
-            # Basic language detection heuristic
-            language = self._simple_language_detect(text)
-
-            language_blocks.append({
-                **block,
-                'language': language
-            })
-
-        return language_blocks
+        return [self._simple_language_detect(text) for text in texts]
 
     def _simple_language_detect(self, text: str) -> str:
         """
@@ -432,14 +540,21 @@ class LayoutDetector:
         if not text or len(text) < 10:
             return 'unknown'
 
-        # Count different script types
-        latin = sum(1 for c in text if '\u0000' <= c <= '\u007F')
-        latin_ext = sum(1 for c in text if '\u0080' <= c <= '\u024F')
-        cyrillic = sum(1 for c in text if '\u0400' <= c <= '\u04FF')
-        arabic = sum(1 for c in text if '\u0600' <= c <= '\u06FF')
-        cjk = sum(1 for c in text if '\u4E00' <= c <= '\u9FFF')
-
-        total = len([c for c in text if c.isalpha()])
+        # Classify every codepoint at once via the precomputed BMP tables
+        codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        bmp = np.minimum(codepoints, _BMP_MAX)
+        counts = np.bincount(SCRIPT_TBL[bmp], minlength=_NUM_SCRIPTS)
+
+        latin = counts[_SCRIPT_LATIN]
+        latin_ext = counts[_SCRIPT_LATIN_EXT]
+        cyrillic = counts[_SCRIPT_CYRILLIC]
+        arabic = counts[_SCRIPT_ARABIC]
+        cjk = counts[_SCRIPT_CJK]
+
+        total = int(np.count_nonzero(ALPHA_TBL[bmp]))
+        if codepoints.max() > _BMP_MAX:
+            # Astral characters are clipped out of the tables; count them directly
+            total += sum(1 for c in text if ord(c) > _BMP_MAX and c.isalpha())
         if total == 0:
             return 'unknown'
 
@@ -455,44 +570,42 @@ class LayoutDetector:
         else:
             return 'mixed'
 
-    def _analyze_language_switching_pattern(self, language_blocks: List[Dict]) -> Dict[str, Any]:
+    def _analyze_language_switching_pattern(self, languages: List[str],
+                                            x_positions: np.ndarray) -> Dict[str, Any]:
         """
         Analyze how languages switch in the document.
 
         Args:
-            language_blocks: List of blocks with language information
+            languages: Detected language of each block, in reading order
+            x_positions: Left edge of each block
 
         Returns:
             Dictionary with pattern analysis
         """
-        if not language_blocks:
+        if not languages:
             return {'type': 'unknown', 'confidence': 0.0, 'switches': 0}
 
-        # Count language switches
-        switches = 0
-        prev_lang = language_blocks[0]['language']
-
-        # Track language distribution by position (x-coordinate)
-        lang_by_x = defaultdict(list)
-
-        for block in language_blocks:
-            lang = block['language']
+        lang_ids = np.fromiter(
+            (self._LANGUAGE_IDS[lang] for lang in languages),
+            dtype=np.int8,
+            count=len(languages)
+        )
 
-            if lang != prev_lang and lang != 'unknown' and prev_lang != 'unknown':
-                switches += 1
+        # Count language switches between consecutive known-language blocks
+        prev_ids, next_ids = lang_ids[:-1], lang_ids[1:]
+        switches = int(np.count_nonzero(
+            (prev_ids != next_ids) & (prev_ids != self._UNKNOWN_ID) & (next_ids != self._UNKNOWN_ID)
+        ))
 
-            prev_lang = lang
-
-            # Group by approximate x-position (for column detection)
-            x_bucket = int(block['x0'] / 50) * 50  # Round to nearest 50
-            lang_by_x[x_bucket].append(lang)
+        # Group by approximate x-position (for column detection), 50pt buckets
+        x_buckets = (np.asarray(x_positions) / self.LANGUAGE_BUCKET_WIDTH).astype(np.int64)
 
         # Analyze pattern type
-        total_blocks = len(language_blocks)
+        total_blocks = len(languages)
         switch_rate = switches / max(total_blocks - 1, 1)
 
         # Check if languages are separated by columns
-        column_separated = self._check_column_language_separation(lang_by_x)
+        column_separated = self._check_column_language_separation(x_buckets, lang_ids)
 
         if column_separated:
             # Column layout with different languages per column
@@ -519,36 +632,42 @@ class LayoutDetector:
                 'switch_rate': switch_rate
             }
 
-    def _check_column_language_separation(self, lang_by_x: Dict[int, List[str]]) -> bool:
+    def _check_column_language_separation(self, x_buckets: np.ndarray, lang_ids: np.ndarray) -> bool:
         """
         Check if different languages are separated by columns.
 
         Args:
-            lang_by_x: Dictionary mapping x-positions to language lists
+            x_buckets: X-position bucket of each block
+            lang_ids: Language id of each block (index into LANGUAGE_LABELS)
 
         Returns:
             True if languages appear to be column-separated
         """
-        if len(lang_by_x) < 2:
+        bucket_keys, bucket_idx = np.unique(x_buckets, return_inverse=True)
+        if len(bucket_keys) < 2:
             return False
 
-        # Check if each x-position group has a dominant language
-        # and different positions have different dominant languages
-        dominant_langs = set()
+        # Language-by-bucket histogram in one bincount
+        num_langs = len(self.LANGUAGE_LABELS)
+        num_blocks = len(lang_ids)
+        flat_idx = bucket_idx * num_langs + lang_ids
+        hist = np.bincount(flat_idx, minlength=len(bucket_keys) * num_langs).reshape(-1, num_langs)
 
-        for x_pos, langs in lang_by_x.items():
-            if not langs:
-                continue
+        # First block index of each (bucket, language) pair, used to break ties
+        # in favour of the language seen first at that x-position
+        first_seen = np.full(hist.size, num_blocks, dtype=np.int64)
+        np.minimum.at(first_seen, flat_idx, np.arange(num_blocks))
+        first_seen = first_seen.reshape(-1, num_langs)
 
-            # Find most common language at this x-position
-            lang_counts = defaultdict(int)
-            for lang in langs:
-                if lang != 'unknown':
-                    lang_counts[lang] += 1
+        # Unknown blocks never count towards a bucket's dominant language
+        hist[:, self._UNKNOWN_ID] = 0
+        has_known = hist.any(axis=1)
+        hist, first_seen = hist[has_known], first_seen[has_known]
 
-            if lang_counts:
-                dominant = max(lang_counts, key=lang_counts.get)
-                dominant_langs.add(dominant)
+        # Check if each x-position group has a dominant language
+        # and different positions have different dominant languages
+        is_max = hist == hist.max(axis=1, keepdims=True)
+        dominant_langs = np.unique(np.where(is_max, first_seen, num_blocks).argmin(axis=1))
 
         # If we have multiple different dominant languages, likely column-separated
         return len(dominant_langs) > 1
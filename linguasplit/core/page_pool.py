@@ -0,0 +1,120 @@
+"""
+Shared worker process pool for per-page PDF work.
+
+Every caller in the process (PDFProcessor, RegionAnalyzer.analyze_document)
+submits page blocks to one pool sized by 'processing.page_workers', so
+documents processed concurrently split one set of workers instead of each
+starting their own. Workers are spawned rather than forked: documents are
+processed from threads, and a child forked from a multi-threaded process
+can deadlock on locks held by the other threads.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from ..utils.config_manager import ConfigManager
+
+
+# Most pages handed to a worker per task (one document open per block)
+PAGE_BLOCK_SIZE = 10
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_workers = 0
+_page_pool_lock = threading.Lock()
+
+
+def page_worker_count(config: ConfigManager) -> int:
+    """
+    Get number of worker processes for per-page work.
+
+    Uses 'processing.page_workers' from config; 0 (default) means one
+    less than the number of CPUs.
+
+    Args:
+        config: Configuration manager
+
+    Returns:
+        Number of worker processes (1 disables parallel processing)
+    """
+    page_workers = config.get('processing.page_workers', 0)
+    if page_workers and page_workers > 0:
+        return page_workers
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def split_pages(num_pages: int, workers: int,
+                max_block_size: int = PAGE_BLOCK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Split pages into contiguous blocks spread evenly over the workers.
+
+    Args:
+        num_pages: Number of pages in the document
+        workers: Number of worker processes
+        max_block_size: Most pages per block
+
+    Returns:
+        List of (page_start, page_end) ranges, end exclusive
+    """
+    block_size = min(max_block_size, -(-num_pages // max(workers, 1))) or 1
+    return [
+        (start, min(start + block_size, num_pages))
+        for start in range(0, num_pages, block_size)
+    ]
+
+
+def submit_page_blocks(
+    max_workers: int,
+    fn: Callable[..., Any],
+    pdf_path: str,
+    page_blocks: List[Tuple[int, int]],
+    *args: Any
+) -> Tuple[ProcessPoolExecutor, List[Future]]:
+    """
+    Submit page blocks to the shared worker pool, (re)creating it for the given size.
+
+    Submission happens under the pool lock so another thread resizing the
+    pool cannot shut it down in between.
+
+    Args:
+        max_workers: Number of worker processes
+        fn: Top-level function called as fn(pdf_path, page_start, page_end, *args)
+        pdf_path: Path to PDF file
+        page_blocks: (page_start, page_end) ranges to process
+        *args: Further picklable arguments for fn
+
+    Returns:
+        Tuple of (pool used, one future per block in order)
+    """
+    global _page_pool, _page_pool_workers
+    with _page_pool_lock:
+        if _page_pool is None or _page_pool_workers != max_workers:
+            if _page_pool is not None:
+                # Work already submitted by other threads still completes
+                _page_pool.shutdown(wait=False)
+            _page_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _page_pool_workers = max_workers
+        futures = [
+            _page_pool.submit(fn, pdf_path, start, end, *args)
+            for start, end in page_blocks
+        ]
+        return _page_pool, futures
+
+
+def discard_page_pool(pool: ProcessPoolExecutor):
+    """
+    Drop a broken page worker pool so the next submission starts a fresh one.
+
+    Args:
+        pool: Pool that raised BrokenProcessPool
+    """
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    pool.shutdown(wait=False)
@@ -6,11 +6,21 @@ and markdown formatting to process multilingual PDFs.
 """
 
 import os
+import re
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from datetime import datetime
 
 from .layout_detector import LayoutDetector
+from .page_pool import discard_page_pool, page_worker_count, split_pages, submit_page_blocks
 from .extractors.column_extractor import ColumnExtractor
 from .extractors.paragraph_extractor import ParagraphExtractor
 from .extractors.section_extractor import SectionExtractor
@@ -22,6 +32,203 @@ from ..utils.config_manager import ConfigManager
 from ..utils.file_helper import FileHelper
 import fitz  # PyMuPDF
 
+try:
+    import fasttext
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    FASTTEXT_AVAILABLE = False
+
+
+# fastText language-ID labels for the languages produced by line splitting
+_FASTTEXT_LABELS = {
+    '__label__en': 'english',
+    '__label__fr': 'french',
+    '__label__rw': 'kinyarwanda',
+}
+
+
+# Loaded fastText models shared by all processors, keyed by model path
+# (BatchProcessor creates a processor per file; None marks an unusable model)
+_fasttext_models: Dict[str, Any] = {}
+_fasttext_models_lock = threading.Lock()
+
+
+# Shared read-only empty mapping for chained lookups (avoids per-call {} literals)
+_EMPTY_DICT = types.MappingProxyType({})
+
+
+# Language boundary markers for splitting mixed-language lines (table-based PDFs)
+_LANG_PATTERNS: Dict[str, List[re.Pattern]] = {
+    lang: [re.compile(pattern) for pattern in lang_patterns]
+    for lang, lang_patterns in {
+        'kinyarwanda': [
+            r'\b(Ingingo|UMUTWE|Icyiciro|Komisiyo|ubufatanye|abakozi|ry\'|by\'|cy\'|ya\s+\d+|bwa\s+)',
+            r'(REPUBULIKA|PEREZIDA|MINISITIRI|ITEKA)',
+        ],
+        'english': [
+            r'\b(Article|CHAPTER|Section|Commission|Commissioners|the|and|of|to|shall|for)\b',
+            r'(pursuant\s+to|having\s+reviewed|adopted|enacted)',
+        ],
+        'french': [
+            r'\b(Article|CHAPITRE|Section|Commission|Commissaires|la|le|de|du|des|pour)\b',
+            r'(vu\s+la|ayant\s+revu|adopte)',
+        ]
+    }.items()
+}
+
+# One alternation per language: "does any marker of this language occur?"
+_LANG_ANY_PATTERN: Dict[str, re.Pattern] = {
+    lang: re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in lang_patterns))
+    for lang, lang_patterns in _LANG_PATTERNS.items()
+}
+
+# Word characters (and apostrophes) leading a marker alternative
+_LITERAL_PREFIX_RE = re.compile(r"[\w']*")
+
+
+def _marker_triggers(patterns: List[re.Pattern]) -> Tuple[str, ...]:
+    """
+    Derive literal substrings guarding a language's marker patterns.
+
+    Each marker pattern is a single group of alternatives; the literal text
+    leading an alternative (up to its first regex escape) occurs in every
+    line that alternative matches. Triggers containing a shorter trigger
+    are redundant and dropped.
+
+    Args:
+        patterns: Compiled marker patterns of one language
+
+    Returns:
+        Tuple of case-sensitive trigger substrings
+    """
+    prefixes = {}
+    for pattern in patterns:
+        source = pattern.pattern
+        group = source[source.index('(') + 1:source.rindex(')')]
+        for alternative in group.split('|'):
+            prefix = _LITERAL_PREFIX_RE.match(alternative.replace("\\'", "'")).group()
+            prefixes[prefix] = None
+    return tuple(
+        prefix for prefix in prefixes
+        if not any(other != prefix and other in prefix for other in prefixes)
+    )
+
+
+# Literal substrings (case-sensitive) at least one of which every marker match
+# of the language contains; lines with none of them skip the regex engine.
+_LANG_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+    lang: _marker_triggers(lang_patterns)
+    for lang, lang_patterns in _LANG_PATTERNS.items()
+}
+
+
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
+class ProcessResult:
+    """Result of processing one PDF (returned to callers as a dict)."""
+
+    success: bool = False
+    pdf_path: str = ''
+    output_files: List[str] = field(default_factory=list)
+    languages_found: List[str] = field(default_factory=list)
+    layout_type: Optional[str] = None
+    layout_confidence: float = 0.0
+    error: Optional[str] = None
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    timestamp: str = ''
+
+
+# Per-process analyzers reused across pages handled by the same worker
+_worker_components: Dict[Tuple[int, Tuple[str, ...]], Tuple[RegionAnalyzer, LanguageDetector]] = {}
+
+
+def _get_worker_components(
+    min_column_gap: int,
+    target_languages: Tuple[str, ...] = ()
+) -> Tuple[RegionAnalyzer, LanguageDetector]:
+    """
+    Get (or create) the region analyzer and language detector for this process.
+
+    Args:
+        min_column_gap: Minimum gap between columns (points)
+        target_languages: Languages to restrict statistical detection to (empty for all)
+
+    Returns:
+        Tuple of (RegionAnalyzer, LanguageDetector)
+    """
+    key = (min_column_gap, target_languages)
+    if key not in _worker_components:
+        _worker_components[key] = (
+            RegionAnalyzer(min_column_gap=min_column_gap),
+            LanguageDetector(restrict_to=list(target_languages))
+        )
+    return _worker_components[key]
+
+
+def _extract_page_regions(
+    page: fitz.Page,
+    region_analyzer: RegionAnalyzer,
+    language_detector: LanguageDetector
+) -> List[Tuple[str, int, Dict[str, str]]]:
+    """
+    Analyze one page and extract the text of each of its regions.
+
+    Args:
+        page: PyMuPDF page object
+        region_analyzer: RegionAnalyzer instance
+        language_detector: LanguageDetector instance
+
+    Returns:
+        List of (layout_type, num_columns, language -> text) tuples, one per region
+    """
+    regions = region_analyzer.analyze_page(page)
+
+    return [
+        (
+            region['layout_type'],
+            region['num_columns'],
+            region_analyzer.extract_region_text(region, language_detector)
+        )
+        for region in regions
+    ]
+
+
+def _process_page_block(
+    pdf_path: str,
+    page_start: int,
+    page_end: int,
+    min_column_gap: int,
+    target_languages: Tuple[str, ...] = ()
+) -> List[List[Tuple[str, int, Dict[str, str]]]]:
+    """
+    Extract region text from a block of pages in a worker process.
+
+    Opens the PDF once per block so the xref table is parsed once for
+    every block of pages, and only loads one page at a time.
+    Top-level so it can be pickled by ProcessPoolExecutor; only plain
+    values cross the process boundary (never fitz objects).
+
+    Args:
+        pdf_path: Path to PDF file
+        page_start: First page number (inclusive, zero-based)
+        page_end: Last page number (exclusive)
+        min_column_gap: Minimum gap between columns (points)
+        target_languages: Languages to restrict statistical detection to
+
+    Returns:
+        For each page in the block, a list of
+        (layout_type, num_columns, language -> text) tuples, one per region
+    """
+    region_analyzer, language_detector = _get_worker_components(min_column_gap, target_languages)
+
+    doc = fitz.open(pdf_path, filetype="pdf")
+    try:
+        return [
+            _extract_page_regions(doc.load_page(page_num), region_analyzer, language_detector)
+            for page_num in range(page_start, page_end)
+        ]
+    finally:
+        doc.close()
+
 
 class PDFProcessor:
     """
@@ -44,6 +251,16 @@ class PDFProcessor:
     - Configurable settings
     """
 
+    # Documents with fewer pages are extracted serially (process startup dominates)
+    MIN_PAGES_FOR_PARALLEL = 4
+
+    # Threads used to format and write per-language output files
+    OUTPUT_WORKERS = 4
+
+    # Detected languages of short unmarked lines (repeated boilerplate) are cached
+    LINE_LANGUAGE_CACHE_SIZE = 4096
+    LINE_LANGUAGE_CACHE_MAX_LEN = 128
+
     def __init__(
         self,
         config: Optional[ConfigManager] = None,
@@ -74,15 +291,39 @@ class PDFProcessor:
         self.layout_detector = LayoutDetector(min_column_gap=min_column_gap)
 
         # Region analyzer for page-level analysis
+        self.min_column_gap = min_column_gap
         self.region_analyzer = RegionAnalyzer(min_column_gap=min_column_gap)
 
-        # Language detector
-        self.language_detector = LanguageDetector()
+        # Language detector, restricted to the document's target languages
+        self.target_languages = tuple(self.config.get(
+            'language.target_languages', ['kinyarwanda', 'english', 'french']
+        ) or ())
+        self.language_detector = LanguageDetector(restrict_to=list(self.target_languages))
+
+        # Optional fastText model for short-line language identification
+        self.fasttext_model = self._load_fasttext_model(
+            self.config.get('language.fasttext_model', '')
+        )
+
+        # Output language filter (comma-separated list, empty means all)
+        extract_only = self.config.get('language.extract_only', '')
+        if isinstance(extract_only, str):
+            self.allowed_languages = frozenset(
+                lang.strip().lower() for lang in extract_only.split(',') if lang.strip()
+            )
+        else:
+            self.allowed_languages = frozenset()
+
+        # LRU cache of line -> detected language (per processor, so per detector)
+        self._line_language_cache: 'OrderedDict[str, str]' = OrderedDict()
 
-        # Extractors (lazy initialization)
-        self.column_extractor = None
-        self.paragraph_extractor = None
-        self.section_extractor = None
+        # Extractors (lazy initialization, one instance per extractor class)
+        self._extractor_classes = {
+            LayoutDetector.LAYOUT_COLUMNS: ColumnExtractor,
+            LayoutDetector.LAYOUT_SEQUENTIAL: ParagraphExtractor,
+            LayoutDetector.LAYOUT_SECTIONS: SectionExtractor,
+        }
+        self._extractors = {}
 
         # Markdown formatter
         include_metadata = self.config.get('output.include_metadata', True)
@@ -92,6 +333,44 @@ class PDFProcessor:
             include_page_markers=include_page_markers
         )
 
+    def _load_fasttext_model(self, model_path: str):
+        """
+        Load a fastText language-ID model (e.g. lid.176.ftz) if configured.
+
+        Args:
+            model_path: Path to the model file ('' disables fastText)
+
+        Returns:
+            Loaded model, or None if fastText or the model is unavailable
+        """
+        if not model_path or not FASTTEXT_AVAILABLE:
+            return None
+
+        # Loaded once per process and shared; the lock also keeps concurrent
+        # batch threads from loading the same model twice
+        with _fasttext_models_lock:
+            if model_path in _fasttext_models:
+                return _fasttext_models[model_path]
+
+            try:
+                model = fasttext.load_model(model_path)
+                self.logger.info(f"Loaded fastText language model: {model_path}")
+            except Exception as e:
+                self.logger.warning(f"Failed to load fastText model {model_path}: {e}")
+                model = None
+
+            _fasttext_models[model_path] = model
+            return model
+
+    def _disable_fasttext_model(self):
+        """Stop using the fastText model (in every processor) after it failed."""
+        model = self.fasttext_model
+        self.fasttext_model = None
+        with _fasttext_models_lock:
+            for model_path, cached in _fasttext_models.items():
+                if cached is model:
+                    _fasttext_models[model_path] = None
+
     def _get_extractor(self, layout_type: str):
         """
         Get or create extractor for given layout type.
@@ -102,34 +381,14 @@ class PDFProcessor:
         Returns:
             Appropriate extractor instance
         """
-        if layout_type == LayoutDetector.LAYOUT_COLUMNS:
-            if not self.column_extractor:
-                self.column_extractor = ColumnExtractor(
-                    language_detector=self.language_detector
-                )
-            return self.column_extractor
+        # Unknown layouts default to the paragraph extractor
+        extractor_class = self._extractor_classes.get(layout_type, ParagraphExtractor)
 
-        elif layout_type == LayoutDetector.LAYOUT_SEQUENTIAL:
-            if not self.paragraph_extractor:
-                self.paragraph_extractor = ParagraphExtractor(
-                    language_detector=self.language_detector
-                )
-            return self.paragraph_extractor
-
-        elif layout_type == LayoutDetector.LAYOUT_SECTIONS:
-            if not self.section_extractor:
-                self.section_extractor = SectionExtractor(
-                    language_detector=self.language_detector
-                )
-            return self.section_extractor
-
-        else:
-            # Default to paragraph extractor
-            if not self.paragraph_extractor:
-                self.paragraph_extractor = ParagraphExtractor(
-                    language_detector=self.language_detector
-                )
-            return self.paragraph_extractor
+        extractor = self._extractors.get(extractor_class)
+        if extractor is None:
+            extractor = extractor_class(language_detector=self.language_detector)
+            self._extractors[extractor_class] = extractor
+        return extractor
 
     def process_pdf(
         self,
@@ -166,20 +425,11 @@ class PDFProcessor:
             FileNotFoundError: If PDF file doesn't exist
             ValueError: If processing fails
         """
+        start_ns = time.monotonic_ns()  # Elapsed time, immune to clock changes
         start_time = datetime.now()
         self.logger.info(f"Processing PDF: {pdf_path}")
 
-        result = {
-            'success': False,
-            'pdf_path': pdf_path,
-            'output_files': [],
-            'languages_found': [],
-            'layout_type': None,
-            'layout_confidence': 0.0,
-            'error': None,
-            'statistics': {},
-            'timestamp': start_time.isoformat()
-        }
+        result = ProcessResult(pdf_path=pdf_path, timestamp=start_time.isoformat())
 
         try:
             # Step 1: Validate input
@@ -193,13 +443,15 @@ class PDFProcessor:
             # Step 3: Detect layout
             self.logger.info("Detecting document layout")
             layout_info = self._detect_layout(pdf_path, config)
-            result['layout_type'] = layout_info['type']
-            result['layout_confidence'] = layout_info['confidence']
+            result.layout_type = layout_info['type']
+            result.layout_confidence = layout_info['confidence']
 
             # Step 4: Extract text using appropriate strategy
             # Check if multi-column layout was detected but not classified as columns
             if layout_info['type'] != LayoutDetector.LAYOUT_COLUMNS:
-                column_count = layout_info.get('details', {}).get('spatial_analysis', {}).get('column_count', 1)
+                details = layout_info.get('details') or _EMPTY_DICT
+                spatial_analysis = details.get('spatial_analysis') or _EMPTY_DICT
+                column_count = spatial_analysis.get('column_count', 1)
                 if column_count >= 2:
                     # Override layout type to columns if multiple columns detected
                     self.logger.info(f"Detected {column_count} columns, using column extraction strategy")
@@ -215,7 +467,7 @@ class PDFProcessor:
             # Post-process to split mixed-language lines (table-based PDFs)
             extracted_text = self._split_mixed_language_lines(extracted_text)
 
-            result['languages_found'] = list(extracted_text.keys())
+            result.languages_found = list(extracted_text.keys())
 
             # Step 5: Format and save output
             self.logger.info("Formatting and saving output")
@@ -224,43 +476,43 @@ class PDFProcessor:
                 output_dir,
                 extracted_text,
                 layout_info,
-                config
+                config,
+                processed_at=start_time
             )
-            result['output_files'] = output_files
+            result.output_files = output_files
 
             # Step 6: Compile statistics
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = (time.monotonic_ns() - start_ns) / 1e9
 
-            result['statistics'] = {
+            result.statistics = {
                 'processing_time': processing_time,
                 'num_languages': len(extracted_text),
                 'total_characters': sum(len(text) for text in extracted_text.values()),
                 'file_size': FileHelper.get_file_size(pdf_path)
             }
 
-            result['success'] = True
+            result.success = True
             self.logger.info(f"Successfully processed {pdf_path} in {processing_time:.2f}s")
 
         except FileNotFoundError as e:
             error_msg = str(e)
-            result['error'] = error_msg
+            result.error = error_msg
             self.logger.error(f"File not found: {error_msg}")
             raise
 
         except ValueError as e:
             error_msg = str(e)
-            result['error'] = error_msg
+            result.error = error_msg
             self.logger.error(f"Processing error: {error_msg}")
             raise
 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            result['error'] = error_msg
+            result.error = error_msg
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        return result
+        return asdict(result)
 
     def _validate_input(self, pdf_path: str):
         """
@@ -442,44 +694,67 @@ class PDFProcessor:
         """
         try:
             doc = fitz.open(pdf_path)
-            all_languages = {}
-
-            # Process each page
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                self.logger.debug(f"Analyzing page {page_num + 1} regions...")
+            num_pages = len(doc)
+            max_workers = self._get_max_workers()
+
+            # Spread pages evenly over the workers; a single block would
+            # just run serially elsewhere
+            page_blocks = split_pages(num_pages, max_workers)
+
+            if (
+                max_workers > 1
+                and num_pages >= self.MIN_PAGES_FOR_PARALLEL
+                and len(page_blocks) > 1
+            ):
+                # Pages are independent once the document is open - fan out
+                # to worker processes, which reopen the PDF themselves
+                doc.close()
+                self.logger.debug(
+                    f"Extracting {num_pages} pages in {len(page_blocks)} blocks "
+                    f"with {max_workers} worker processes"
+                )
 
-                # Analyze page regions
-                regions = self.region_analyzer.analyze_page(page)
+                executor, futures = submit_page_blocks(
+                    max_workers, _process_page_block, pdf_path, page_blocks,
+                    self.min_column_gap, self.target_languages
+                )
+                try:
+                    page_results = [
+                        page_regions
+                        for future in futures
+                        for page_regions in future.result()
+                    ]
+                except BrokenProcessPool:
+                    discard_page_pool(executor)
+                    raise
+            else:
+                page_results = [
+                    _extract_page_regions(doc[page_num], self.region_analyzer, self.language_detector)
+                    for page_num in range(num_pages)
+                ]
+                doc.close()
 
+            # Merge in page order (collect parts, join once per language)
+            language_parts = defaultdict(list)
+            for page_num, page_regions in enumerate(page_results):
                 self.logger.debug(
-                    f"Page {page_num + 1}: Found {len(regions)} regions"
+                    f"Page {page_num + 1}: Found {len(page_regions)} regions"
                 )
 
-                # Extract text from each region
-                for region_idx, region in enumerate(regions):
-                    layout_type = region['layout_type']
-                    num_columns = region['num_columns']
-
+                for region_idx, (layout_type, num_columns, region_text) in enumerate(page_regions):
                     self.logger.debug(
                         f"  Region {region_idx + 1}: {layout_type} "
                         f"({num_columns} column{'s' if num_columns > 1 else ''})"
                     )
 
-                    # Extract text from region
-                    region_text = self.region_analyzer.extract_region_text(
-                        region,
-                        self.language_detector
-                    )
-
                     # Merge with accumulated text
                     for language, text in region_text.items():
-                        if language in all_languages:
-                            all_languages[language] += '\n\n' + text
-                        else:
-                            all_languages[language] = text
+                        language_parts[language].append(text)
 
-            doc.close()
+            all_languages = {
+                language: '\n\n'.join(parts)
+                for language, parts in language_parts.items()
+            }
 
             if not all_languages:
                 raise ValueError("No text extracted from any region")
@@ -494,13 +769,26 @@ class PDFProcessor:
         except Exception as e:
             raise ValueError(f"Region-based extraction failed: {str(e)}")
 
+    def _get_max_workers(self) -> int:
+        """
+        Get number of worker processes for per-page extraction.
+
+        Uses 'processing.page_workers' from config; 0 (default) means one
+        less than the number of CPUs.
+
+        Returns:
+            Number of worker processes (1 disables parallel extraction)
+        """
+        return page_worker_count(self.config)
+
     def _save_output(
         self,
         pdf_path: str,
         output_dir: str,
         extracted_text: Dict[str, str],
         layout_info: Dict[str, Any],
-        config: Optional[Dict[str, Any]]
+        config: Optional[Dict[str, Any]],
+        processed_at: Optional[datetime] = None
     ) -> List[str]:
         """
         Format and save extracted text to output files.
@@ -511,6 +799,7 @@ class PDFProcessor:
             extracted_text: Extracted text by language
             layout_info: Layout detection result
             config: Processing configuration
+            processed_at: Processing start time for metadata (default: now)
 
         Returns:
             List of created output file paths
@@ -537,65 +826,48 @@ class PDFProcessor:
             'source': os.path.basename(pdf_path),
             'layout_type': layout_info['type'],
             'layout_confidence': f"{layout_info['confidence']:.2f}",
-            'processed_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'processed_date': (processed_at or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
         }
 
-        # Get language filter from config
-        extract_only = self.config.get('language.extract_only', '')
-        if isinstance(extract_only, str) and extract_only.strip():
-            # Parse comma-separated language list
-            allowed_languages = [lang.strip().lower() for lang in extract_only.split(',')]
+        # Apply language filter parsed from config at init
+        if self.allowed_languages:
             # Filter extracted text to only include selected languages
             filtered_text = {
                 lang: text for lang, text in extracted_text.items()
-                if lang.lower() in allowed_languages
+                if lang.lower() in self.allowed_languages
             }
             if filtered_text:
                 extracted_text = filtered_text
                 self.logger.info(f"Filtered to extract only: {', '.join(filtered_text.keys())}")
             else:
-                self.logger.warning(f"No languages matched filter '{extract_only}', extracting all")
+                self.logger.warning(
+                    f"No languages matched filter '{self.config.get('language.extract_only', '')}', "
+                    f"extracting all"
+                )
 
         if save_separate:
-            # Save each language to separate file
-            for language, text in extracted_text.items():
-                if output_format == 'markdown':
-                    # Format as markdown
-                    formatted_text = self.markdown_formatter.format_document(
-                        text=text,
-                        metadata=metadata,
-                        language=language
+            # Save each language to separate file; formatting and writes
+            # overlap across threads, results keep language order
+            items = list(extracted_text.items())
+            if len(items) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(items), self.OUTPUT_WORKERS)) as executor:
+                    futures = [
+                        executor.submit(
+                            self._format_and_write_one,
+                            language, text, base_name, output_dir, metadata, output_format
+                        )
+                        for language, text in items
+                    ]
+                    written = [future.result() for future in futures]
+            else:
+                written = [
+                    self._format_and_write_one(
+                        language, text, base_name, output_dir, metadata, output_format
                     )
-                    extension = 'md'
-                elif output_format == 'text':
-                    formatted_text = text
-                    extension = 'txt'
-                elif output_format == 'json':
-                    import json
-                    formatted_text = json.dumps({
-                        'language': language,
-                        'text': text,
-                        'metadata': metadata
-                    }, indent=2, ensure_ascii=False)
-                    extension = 'json'
-                else:
-                    # Default to text
-                    formatted_text = text
-                    extension = 'txt'
-
-                # Create filename
-                filename = f"{base_name}_{language}.{extension}"
-                filepath = os.path.join(output_dir, filename)
+                    for language, text in items
+                ]
 
-                # Note: We overwrite existing files instead of creating duplicates
-                # This ensures clean output when reprocessing PDFs
-
-                # Write file
-                if FileHelper.write_text_file(filepath, formatted_text):
-                    output_files.append(filepath)
-                    self.logger.debug(f"Saved {language} text to {filepath}")
-                else:
-                    self.logger.warning(f"Failed to save {language} text to {filepath}")
+            output_files.extend(filepath for filepath in written if filepath)
 
         else:
             # Save all languages to single file
@@ -614,11 +886,11 @@ class PDFProcessor:
                 extension = 'md'
 
             elif output_format == 'json':
-                import json
-                combined_text = json.dumps({
+                # Serialized directly into the file below
+                combined_text = {
                     'languages': extracted_text,
                     'metadata': metadata
-                }, indent=2, ensure_ascii=False)
+                }
                 extension = 'json'
 
             else:
@@ -639,7 +911,12 @@ class PDFProcessor:
                 filepath = os.path.join(output_dir, filename)
 
             # Write file
-            if FileHelper.write_text_file(filepath, combined_text):
+            if extension == 'json':
+                written = FileHelper.write_json_file(filepath, combined_text)
+            else:
+                written = FileHelper.write_text_file(filepath, combined_text)
+
+            if written:
                 output_files.append(filepath)
                 self.logger.debug(f"Saved combined text to {filepath}")
             else:
@@ -647,6 +924,73 @@ class PDFProcessor:
 
         return output_files
 
+    def _format_and_write_one(
+        self,
+        language: str,
+        text: str,
+        base_name: str,
+        output_dir: str,
+        metadata: Dict[str, Any],
+        output_format: str
+    ) -> Optional[str]:
+        """
+        Format one language's text and write it to its own output file.
+
+        Args:
+            language: Language name
+            text: Extracted text for the language
+            base_name: Base output filename
+            output_dir: Output directory
+            metadata: Document metadata
+            output_format: Output format (markdown/text/json)
+
+        Returns:
+            Path of the written file, or None if writing failed
+        """
+        if output_format == 'markdown':
+            # Format as markdown
+            formatted_text = self.markdown_formatter.format_document(
+                text=text,
+                metadata=metadata,
+                language=language
+            )
+            extension = 'md'
+        elif output_format == 'text':
+            formatted_text = text
+            extension = 'txt'
+        elif output_format == 'json':
+            # Serialized directly into the file below
+            formatted_text = {
+                'language': language,
+                'text': text,
+                'metadata': metadata
+            }
+            extension = 'json'
+        else:
+            # Default to text
+            formatted_text = text
+            extension = 'txt'
+
+        # Create filename
+        filename = f"{base_name}_{language}.{extension}"
+        filepath = os.path.join(output_dir, filename)
+
+        # Note: We overwrite existing files instead of creating duplicates
+        # This ensures clean output when reprocessing PDFs
+
+        # Write file
+        if extension == 'json':
+            written = FileHelper.write_json_file(filepath, formatted_text)
+        else:
+            written = FileHelper.write_text_file(filepath, formatted_text)
+
+        if written:
+            self.logger.debug(f"Saved {language} text to {filepath}")
+            return filepath
+
+        self.logger.warning(f"Failed to save {language} text to {filepath}")
+        return None
+
     def _split_mixed_language_lines(self, extracted_text: Dict[str, str]) -> Dict[str, str]:
         """
         Split lines that contain multiple languages side-by-side (table-based PDFs).
@@ -660,63 +1004,69 @@ class PDFProcessor:
         Returns:
             Dictionary with properly separated languages
         """
-        import re
+        result = {lang: [] for lang in ['kinyarwanda', 'english', 'french']}
         
-        # Patterns to detect language boundaries within a line
-        patterns = {
-            'kinyarwanda': [
-                r'\b(Ingingo|UMUTWE|Icyiciro|Komisiyo|ubufatanye|abakozi|ry\'|by\'|cy\'|ya\s+\d+|bwa\s+)',
-                r'(REPUBULIKA|PEREZIDA|MINISITIRI|ITEKA)',
-            ],
-            'english': [
-                r'\b(Article|CHAPTER|Section|Commission|Commissioners|the|and|of|to|shall|for)\b',
-                r'(pursuant\s+to|having\s+reviewed|adopted|enacted)',
-            ],
-            'french': [
-                r'\b(Article|CHAPITRE|Section|Commission|Commissaires|la|le|de|du|des|pour)\b',
-                r'(vu\s+la|ayant\s+revu|adopte)',
-            ]
-        }
+        # Pass 1: route lines by their language markers. Each entry is
+        # (target language or None if undecided, text, source language),
+        # kept in document order.
+        placements = []
+        undecided = []
         
-        result = {lang: [] for lang in ['kinyarwanda', 'english', 'french']}
+        # Marker languages occurring anywhere in the document; a line can only
+        # match those, so monolingual text scans one pattern per line
+        present_patterns = [
+            (marker_lang, _LANG_TRIGGERS[marker_lang], pattern)
+            for marker_lang, pattern in _LANG_ANY_PATTERN.items()
+            if any(pattern.search(text) for text in extracted_text.values() if text)
+        ]
         
         # Process each language's text
         for lang, text in extracted_text.items():
             if not text:
                 continue
                 
-            lines = text.split('\n')
-            
-            for line in lines:
-                line = line.strip()
+            for raw in text.splitlines():
+                line = raw.strip()
                 if not line:
                     continue
                 
-                # Check if line contains multiple language markers (mixed line)
-                kiny_match = any(re.search(p, line) for p in patterns['kinyarwanda'])
-                eng_match = any(re.search(p, line) for p in patterns['english'])
-                fr_match = any(re.search(p, line) for p in patterns['french'])
-                
-                mixed_count = sum([kiny_match, eng_match, fr_match])
+                # Scan once per language for markers; the result also decides
+                # non-mixed lines below, so no second regex pass is needed.
+                # The substring check rules out most lines before the regex.
+                marker_langs = [
+                    marker_lang for marker_lang, triggers, pattern in present_patterns
+                    if any(trigger in line for trigger in triggers) and pattern.search(line)
+                ]
                 
-                if mixed_count >= 2:
+                if len(marker_langs) >= 2:
                     # This is a mixed line, try to split it
-                    segments = self._split_line_by_language(line, patterns)
+                    segments = self._split_line_by_language(line)
                     for seg_lang, seg_text in segments.items():
                         if seg_text:
-                            result[seg_lang].append(seg_text)
+                            placements.append((seg_lang, seg_text, lang))
+                elif marker_langs:
+                    placements.append((marker_langs[0], line, lang))
                 else:
-                    # Not a mixed line - but still check if it's in the RIGHT language
-                    detected_lang = self._detect_line_language(line, patterns)
-                    
-                    if detected_lang in result:
-                        result[detected_lang].append(line)
-                    elif lang in result:
-                        # Only use the original language if detection failed
-                        result[lang].append(line)
-                    else:
-                        # Fallback to english
-                        result['english'].append(line)
+                    # No markers - needs statistical detection (batched below)
+                    undecided.append(len(placements))
+                    placements.append((None, line, lang))
+        
+        # Pass 2: detect all undecided lines in one batch
+        detected = self._detect_lines_language([placements[i][1] for i in undecided])
+        for i, detected_lang in zip(undecided, detected):
+            placements[i] = (detected_lang,) + placements[i][1:]
+        
+        # Pass 3: place lines in document order, keeping the source
+        # language only when detection gave a language we don't split into
+        for detected_lang, line, lang in placements:
+            if detected_lang in result:
+                result[detected_lang].append(line)
+            elif lang in result:
+                # Only use the original language if detection failed
+                result[lang].append(line)
+            else:
+                # Fallback to english
+                result['english'].append(line)
         
         # Convert lists to strings
         final_result = {}
@@ -729,19 +1079,17 @@ class PDFProcessor:
         
         return final_result if final_result else extracted_text
     
-    def _split_line_by_language(self, line: str, patterns: Dict) -> Dict[str, str]:
+    def _split_line_by_language(self, line: str) -> Dict[str, str]:
         """
         Split a single line that contains multiple languages.
         
         Strategy: Find language markers and split the line at those points.
         """
-        import re
-        
         # Find all marker positions
         markers = []
-        for lang, lang_patterns in patterns.items():
+        for lang, lang_patterns in _LANG_PATTERNS.items():
             for pattern in lang_patterns:
-                for match in re.finditer(pattern, line):
+                for match in pattern.finditer(line):
                     markers.append({
                         'position': match.start(),
                         'language': lang,
@@ -771,28 +1119,87 @@ class PDFProcessor:
         # Join segments for each language
         return {lang: ' '.join(segs) for lang, segs in segments.items()}
     
-    def _detect_line_language(self, line: str, patterns: Dict) -> str:
+    def _detect_lines_language(self, lines: List[str]) -> List[str]:
         """
-        Detect which language a single line is in.
+        Detect the language of lines that carry no language markers.
+        
+        Repeated lines are detected once, short lines are served from an
+        LRU cache, and the rest go through the detector in a single batch.
+        
+        Args:
+            lines: Lines of text
+            
+        Returns:
+            Detected language for each line ('english' when undetermined)
         """
-        import re
+        detected = ['english'] * len(lines)  # Default fallback
+        cache = self._line_language_cache
+        pending = {}  # line -> indices awaiting detection
         
-        scores = {}
-        for lang, lang_patterns in patterns.items():
-            score = sum(1 for pattern in lang_patterns if re.search(pattern, line))
-            if score > 0:
-                scores[lang] = score
+        for i, line in enumerate(lines):
+            # Only long lines carry enough signal for statistical detection
+            if len(line) <= 50:
+                continue
+            
+            cached = cache.get(line)
+            if cached is not None:
+                cache.move_to_end(line)
+                detected[i] = cached
+            else:
+                pending.setdefault(line, []).append(i)
         
-        if scores:
-            return max(scores, key=scores.get)
+        if not pending:
+            return detected
         
-        # Fallback: use language detector
-        if self.language_detector and len(line) > 50:
-            detected_lang, confidence = self.language_detector.detect_language(line)
-            if confidence > 0.6:
-                return detected_lang
+        unique_lines = list(pending)
+        for line, language in zip(unique_lines, self._detect_lines_uncached(unique_lines)):
+            for i in pending[line]:
+                detected[i] = language
+            
+            if len(line) <= self.LINE_LANGUAGE_CACHE_MAX_LEN:
+                cache[line] = language
+                if len(cache) > self.LINE_LANGUAGE_CACHE_SIZE:
+                    cache.popitem(last=False)
         
-        return 'english'  # Default fallback
+        return detected
+    
+    def _detect_lines_uncached(self, lines: List[str]) -> List[str]:
+        """
+        Run statistical language detection on lines in one batch call.
+        
+        Args:
+            lines: Lines of text (each longer than 50 characters)
+            
+        Returns:
+            Detected language for each line ('english' when undetermined)
+        """
+        detected = ['english'] * len(lines)  # Default fallback
+        
+        # Fallback: fastText (native, fast on short lines) if available,
+        # otherwise the general language detector
+        if self.fasttext_model is not None:
+            try:
+                labels, probs = self.fasttext_model.predict(
+                    [line.replace('\n', ' ') for line in lines], k=1
+                )
+            except Exception as e:
+                # e.g. fasttext 0.9.2 under NumPy 2 ("Unable to avoid copy")
+                self.logger.warning(f"fastText prediction failed, using language detector instead: {e}")
+                self._disable_fasttext_model()
+            else:
+                for i, (line_labels, line_probs) in enumerate(zip(labels, probs)):
+                    if line_labels and line_probs[0] > 0.6:
+                        label = line_labels[0]
+                        detected[i] = _FASTTEXT_LABELS.get(label, label[len('__label__'):])
+                return detected
+        
+        if self.language_detector:
+            results = self.language_detector.detect_batch(lines)
+            for i, (detected_lang, confidence) in enumerate(results):
+                if confidence > 0.6:
+                    detected[i] = detected_lang
+        
+        return detected
 
     def get_supported_layouts(self) -> List[str]:
         """
@@ -829,11 +1236,13 @@ class PDFProcessor:
             # Get file info
             file_info = FileHelper.get_file_info(pdf_path)
 
-            # Detect layout
-            layout_info = self.layout_detector.detect_layout(pdf_path)
+            # Detect layout, keeping the page extractions it makes so the
+            # preview can reuse page 0 instead of extracting it again
+            page_cache: Dict[int, Dict] = {}
+            layout_info = self.layout_detector.detect_layout(pdf_path, page_cache=page_cache)
 
             # Get preview
-            preview = self._get_preview(pdf_path)
+            preview = self._get_preview(pdf_path, page_cache=page_cache)
 
             return {
                 'file_info': file_info,
@@ -848,25 +1257,37 @@ class PDFProcessor:
                 'error': str(e)
             }
 
-    def _get_preview(self, pdf_path: str, max_chars: int = 500) -> str:
+    def _get_preview(
+        self,
+        pdf_path: str,
+        max_chars: int = 500,
+        page_cache: Optional[Dict[int, Dict]] = None
+    ) -> str:
         """
         Get text preview from first page.
 
         Args:
             pdf_path: Path to PDF file
             max_chars: Maximum characters to return
+            page_cache: Optional page index -> get_text("dict") output from an
+                earlier pass over the document; page 0 is reused when present
 
         Returns:
             Preview text
         """
         try:
-            import fitz
-            doc = fitz.open(pdf_path)
-            if len(doc) > 0:
-                text = doc[0].get_text()
-                doc.close()
-                return text[:max_chars] + ('...' if len(text) > max_chars else '')
-            doc.close()
-            return ""
+            if page_cache and 0 in page_cache:
+                # Same text as get_text("text"): each line's spans, newline-terminated
+                text = ''.join([
+                    ''.join([span['text'] for span in line.get('spans', [])]) + '\n'
+                    for block in page_cache[0]['blocks'] if block.get('type') == 0
+                    for line in block.get('lines', [])
+                ])
+            else:
+                with fitz.open(pdf_path) as doc:
+                    if doc.page_count == 0:
+                        return ""
+                    text = doc.load_page(0).get_text("text")
+            return text[:max_chars] + ('...' if len(text) > max_chars else '')
         except Exception:
             return ""
@@ -5,10 +5,348 @@ Analyzes each page in horizontal regions/sections to detect layout
 changes within a single page (e.g., full-width header, then multi-column body).
 """
 
+import re
+import sys
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
 import fitz  # PyMuPDF
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
-from sklearn.cluster import KMeans
+
+from .page_pool import discard_page_pool, page_worker_count, split_pages, submit_page_blocks
+from ..utils.config_manager import ConfigManager
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Heading markers used to recognise table-based (side-by-side) blocks
+_KINY_MARKER_RE = re.compile(r'(Ingingo ya|UMUTWE WA|Icyiciro cya|Komisiyo)')
+_ENG_MARKER_RE = re.compile(
+    r'(Article (?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|\d+):|CHAPTER |'
+    r'Section (?:One|Two|Three|Four):|Commission)'
+)
+_FR_MARKER_RE = re.compile(
+    r'(Article (?:premier|deuxième):|CHAPITRE |Section (?:première|deuxième):|Commission)'
+)
+
+# Characteristic words for line-by-line table splitting
+_KINY_LINE_WORDS = (
+    'ingingo', 'umutwe', 'icyiciro', 'komisiyo', 'uburenganzira', 'bwa', 'ya', 'rya',
+    'cya', 'kwa', 'zihariye', 'rusange', 'ububasha', 'inshingano', 'itegeko', 'rigena',
+    'imiterere', 'imikorere', 'ibirimo', 'kuwa', 'ryo',
+)
+_ENG_LINE_WORDS = (
+    'article', 'chapter', 'section', 'commission', 'the', 'of', 'and', 'to', 'rights',
+    'powers', 'missions', 'special', 'ordinary',
+)
+_FR_LINE_WORDS = (
+    'article', 'chapitre', 'section', 'commission', 'la', 'le', 'de', 'et', 'des',
+    'droits', 'pouvoirs', 'missions', 'particulières', 'ordinaires',
+)
+_ENG_LINE_WORD_SET = frozenset(_ENG_LINE_WORDS)
+_FR_LINE_WORD_SET = frozenset(_FR_LINE_WORDS)
+
+
+def _count_line_words(
+    line_lower: str,
+    tokens: set,
+    words: Tuple[str, ...],
+    word_set: frozenset
+) -> int:
+    """
+    Count words that appear as space-separated tokens or at either end of a line.
+
+    Args:
+        line_lower: Lowercased line
+        tokens: Set of the line's space-separated tokens
+        words: Words to count
+        word_set: The same words as a frozenset
+
+    Returns:
+        Number of distinct words found
+    """
+    # Prefix/suffix matches (e.g. "articles" starts with "article") need the
+    # per-word check; otherwise only whole tokens count
+    if line_lower.startswith(words) or line_lower.endswith(words):
+        return sum(
+            1 for word in words
+            if word in tokens or line_lower.startswith(word) or line_lower.endswith(word)
+        )
+    return len(tokens & word_set)
+
+
+def _build_line_word_automaton():
+    """
+    Build an Aho-Corasick automaton over all line-scoring words.
+
+    Returns:
+        Automaton mapping each word to (word, language indices), where
+        0/1/2 are Kinyarwanda/English/French
+    """
+    word_langs: Dict[str, List[int]] = {}
+    for lang_idx, words in enumerate((_KINY_LINE_WORDS, _ENG_LINE_WORDS, _FR_LINE_WORDS)):
+        for word in words:
+            word_langs.setdefault(word, []).append(lang_idx)
+
+    automaton = ahocorasick.Automaton()
+    for word, langs in word_langs.items():
+        automaton.add_word(word, (word, tuple(langs)))
+    automaton.make_automaton()
+    return automaton
+
+
+_LINE_WORD_AUTOMATON = _build_line_word_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _score_line_languages(line_lower: str) -> Tuple[int, int, int]:
+    """
+    Score a lowercased line for Kinyarwanda, English and French marker words.
+
+    Kinyarwanda words count anywhere in the line (weight 2); English and
+    French words count as space-separated tokens or at either end of the
+    line. Each distinct word counts once.
+
+    Args:
+        line_lower: Lowercased line
+
+    Returns:
+        Tuple of (kinyarwanda, english, french) scores
+    """
+    if _LINE_WORD_AUTOMATON is not None:
+        # One C-level scan finds every occurrence of every word
+        line_len = len(line_lower)
+        found = (set(), set(), set())
+        for end, (word, langs) in _LINE_WORD_AUTOMATON.iter(line_lower):
+            start = end - len(word) + 1
+            stop = end + 1
+            for lang_idx in langs:
+                if (lang_idx == 0 or start == 0 or stop == line_len
+                        or (line_lower[start - 1] == ' ' and line_lower[stop] == ' ')):
+                    found[lang_idx].add(word)
+        return 2 * len(found[0]), len(found[1]), len(found[2])
+
+    kiny_score = sum(2 for word in _KINY_LINE_WORDS if word in line_lower)
+    tokens = set(line_lower.split(' '))
+    eng_score = _count_line_words(line_lower, tokens, _ENG_LINE_WORDS, _ENG_LINE_WORD_SET)
+    fr_score = _count_line_words(line_lower, tokens, _FR_LINE_WORDS, _FR_LINE_WORD_SET)
+    return kiny_score, eng_score, fr_score
+
+
+# Text blocks of a page or region as parallel arrays (structure of arrays):
+# float64 bounding-box arrays plus a list of block texts. Sizes and centres
+# are derived on demand (see _x_centers).
+RegionBlocks = namedtuple('RegionBlocks', ['x0', 'y0', 'x1', 'y1', 'texts'])
+
+
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
+class TextBlock:
+    """A single (virtual) text block with its geometry."""
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    text: str
+
+    @property
+    def width(self) -> float:
+        return self.x1 - self.x0
+
+    @property
+    def height(self) -> float:
+        return self.y1 - self.y0
+
+    @property
+    def x_center(self) -> float:
+        return (self.x0 + self.x1) / 2
+
+    @property
+    def y_center(self) -> float:
+        return (self.y0 + self.y1) / 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the block as a plain dictionary, including derived geometry."""
+        block = asdict(self)
+        block.update(
+            width=self.width,
+            height=self.height,
+            x_center=self.x_center,
+            y_center=self.y_center
+        )
+        return block
+
+
+def _x_centers(blocks: RegionBlocks) -> np.ndarray:
+    """
+    Compute the horizontal centre of every block.
+
+    Args:
+        blocks: Text blocks
+
+    Returns:
+        Array of block x-centres
+    """
+    return (blocks.x0 + blocks.x1) * 0.5
+
+
+def _reading_order(blocks: RegionBlocks) -> Optional[np.ndarray]:
+    """
+    Order blocks top to bottom, then left to right.
+
+    Region blocks arrive sorted by y0 (see _detect_regions), so sorting is
+    only needed to break ties between blocks sharing a y0.
+
+    Args:
+        blocks: Text blocks, sorted by y0
+
+    Returns:
+        Block indices in reading order, or None when the blocks already are
+    """
+    y0 = blocks.y0
+    if np.all(y0[1:] > y0[:-1]):
+        return None
+    # lexsort is stable, keys are applied last-first: y0 then x0
+    return np.lexsort((blocks.x0, y0))
+
+
+def _select_blocks(blocks: RegionBlocks, indices: np.ndarray) -> RegionBlocks:
+    """
+    Take a subset of blocks, in the given order.
+
+    Args:
+        blocks: Source blocks
+        indices: Block indices to keep
+
+    Returns:
+        RegionBlocks holding only the selected blocks
+    """
+    return RegionBlocks(
+        *(values[indices] for values in blocks[:-1]),
+        texts=[blocks.texts[i] for i in indices]
+    )
+
+
+def _kmeans_1d(values, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact k-means clustering of scalar values.
+
+    In one dimension optimal clusters are contiguous runs of the sorted
+    values, so the minimum within-cluster sum of squares is found by
+    dynamic programming over the distinct values (weighted by their
+    multiplicity) - no random restarts, and identical values always share
+    a cluster. With fewer distinct values than k, the surplus clusters
+    are left empty.
+
+    Args:
+        values: 1-D sequence of values
+        k: Number of clusters
+
+    Returns:
+        Tuple of (labels, centers); cluster ids are ordered left to right
+    """
+    x = np.asarray(values, dtype=np.float64).ravel()
+    uniq, inverse, weights = np.unique(x, return_inverse=True, return_counts=True)
+    m = len(uniq)
+
+    if m <= k:
+        centers = np.concatenate([uniq, np.full(k - m, uniq[-1])])
+        return inverse, centers
+
+    # Weighted prefix sums of mean-centred values give O(1) segment costs
+    shifted = uniq - np.average(uniq, weights=weights)
+    cum_w = np.concatenate(([0.0], np.cumsum(weights)))
+    cum_s = np.concatenate(([0.0], np.cumsum(weights * shifted)))
+    cum_s2 = np.concatenate(([0.0], np.cumsum(weights * shifted * shifted)))
+
+    def segment_cost(start, end):
+        return (cum_s2[end] - cum_s2[start]
+                - (cum_s[end] - cum_s[start]) ** 2 / (cum_w[end] - cum_w[start]))
+
+    if k == 2:
+        # Single sweep over the m - 1 possible split points
+        splits = np.arange(1, m)
+        split = splits[np.argmin(segment_cost(0, splits) + segment_cost(splits, m))]
+        labels = (inverse >= split).astype(np.intp)
+        centers = np.array([
+            np.average(uniq[:split], weights=weights[:split]),
+            np.average(uniq[split:], weights=weights[split:]),
+        ])
+        return labels, centers
+
+    # cost[i, j]: sum of squares of the segment uniq[i:j]
+    i = np.arange(m + 1)[:, None]
+    j = np.arange(m + 1)[None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cost = segment_cost(i, j)
+    cost[j <= i] = np.inf
+
+    # best[j]: minimal cost of uniq[:j] split into the clusters so far
+    best = cost[0].copy()
+    split_points = []
+    for _ in range(1, k):
+        total = best[:, None] + cost
+        split = np.argmin(total, axis=0)
+        best = total[split, np.arange(m + 1)]
+        split_points.append(split)
+
+    # Walk the split points back from the end to recover cluster bounds
+    bounds = [m]
+    for split in reversed(split_points):
+        bounds.append(split[bounds[-1]])
+    bounds.reverse()
+
+    cluster_of_uniq = np.empty(m, dtype=np.intp)
+    centers = np.empty(k)
+    for cluster, (start, end) in enumerate(zip([0] + bounds[:-1], bounds)):
+        cluster_of_uniq[start:end] = cluster
+        centers[cluster] = np.average(uniq[start:end], weights=weights[start:end])
+
+    return cluster_of_uniq[inverse], centers
+
+
+# Analyzers reused across page blocks handled by the same worker process
+_block_analyzers: Dict[Tuple[int, int], 'RegionAnalyzer'] = {}
+
+
+def _analyze_page_block(
+    pdf_path: str,
+    page_start: int,
+    page_end: int,
+    min_region_height: int,
+    min_column_gap: int
+) -> List[List[Dict[str, Any]]]:
+    """
+    Analyze a block of pages in a worker process.
+
+    Top-level so it can be pickled by ProcessPoolExecutor; the regions
+    returned hold only plain values and NumPy arrays (never fitz objects).
+
+    Args:
+        pdf_path: Path to PDF file
+        page_start: First page number (inclusive, zero-based)
+        page_end: Last page number (exclusive)
+        min_region_height: Minimum height for a valid region (points)
+        min_column_gap: Minimum gap between columns (points)
+
+    Returns:
+        For each page in the block, the list of region dictionaries
+        (see RegionAnalyzer.analyze_page)
+    """
+    key = (min_region_height, min_column_gap)
+    analyzer = _block_analyzers.get(key)
+    if analyzer is None:
+        analyzer = _block_analyzers[key] = RegionAnalyzer(
+            min_region_height=min_region_height,
+            min_column_gap=min_column_gap
+        )
+
+    with fitz.open(pdf_path, filetype="pdf") as doc:
+        return [analyzer.analyze_page(doc.load_page(page_num)) for page_num in range(page_start, page_end)]
 
 
 class RegionAnalyzer:
@@ -29,6 +367,11 @@ class RegionAnalyzer:
     LAYOUT_COLUMNS = 'columns'
     LAYOUT_MIXED = 'mixed'
 
+    # Bounded memo of detect_language results for recurring region text
+    # (headers, footers, short column fragments)
+    DETECTION_CACHE_SIZE = 4096
+    DETECTION_CACHE_MAX_LEN = 2048
+
     def __init__(self, min_region_height: int = 50, min_column_gap: int = 30):
         """
         Initialize region analyzer.
@@ -39,6 +382,7 @@ class RegionAnalyzer:
         """
         self.min_region_height = min_region_height
         self.min_column_gap = min_column_gap
+        self._detection_cache: 'OrderedDict[Tuple[Any, str], Tuple[str, float]]' = OrderedDict()
 
     def analyze_page(self, page: fitz.Page) -> List[Dict[str, Any]]:
         """
@@ -51,14 +395,16 @@ class RegionAnalyzer:
             List of region dictionaries with keys:
                 - y_start: Region start y-coordinate
                 - y_end: Region end y-coordinate
-                - blocks: Text blocks in this region
+                - blocks: Text blocks in this region (RegionBlocks)
                 - layout_type: Detected layout (single/columns)
                 - num_columns: Number of columns (if multi-column)
+                - column_clusters: (num_columns, per-block column labels) from
+                  layout detection, or None for single-column regions
         """
         # Extract text blocks
         blocks = self._extract_text_blocks(page)
 
-        if not blocks:
+        if not blocks.texts:
             return []
 
         # Group blocks into horizontal regions
@@ -66,13 +412,58 @@ class RegionAnalyzer:
 
         # Analyze layout for each region
         for region in regions:
-            region['layout_type'], region['num_columns'] = self._detect_region_layout(
+            layout_type, num_columns, column_labels = self._detect_region_layout(
                 region['blocks']
             )
+            region['layout_type'] = layout_type
+            region['num_columns'] = num_columns
+            region['column_clusters'] = (
+                (num_columns, column_labels) if column_labels is not None else None
+            )
 
         return regions
 
-    def _extract_text_blocks(self, page: fitz.Page) -> List[Dict]:
+    def analyze_document(
+        self,
+        pdf_path: str,
+        workers: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Analyze every page of a PDF, spreading pages over worker processes.
+
+        Pages are split into contiguous blocks on the shared page pool; each
+        worker opens the document once per block. Results are returned in
+        page order.
+
+        Args:
+            pdf_path: Path to PDF file
+            workers: Number of worker processes (None for
+                'processing.page_workers' from the user config, 1 to
+                analyze in this process)
+
+        Returns:
+            For each page, the list of region dictionaries from analyze_page
+        """
+        if workers is None:
+            workers = page_worker_count(ConfigManager())
+
+        with fitz.open(pdf_path, filetype="pdf") as doc:
+            num_pages = doc.page_count
+            page_blocks = split_pages(num_pages, workers)
+            if workers <= 1 or len(page_blocks) < 2:
+                return [self.analyze_page(doc.load_page(page_num)) for page_num in range(num_pages)]
+
+        executor, futures = submit_page_blocks(
+            workers, _analyze_page_block, pdf_path, page_blocks,
+            self.min_region_height, self.min_column_gap
+        )
+        try:
+            return [regions for future in futures for regions in future.result()]
+        except BrokenProcessPool:
+            discard_page_pool(executor)
+            raise
+
+    def _extract_text_blocks(self, page: fitz.Page) -> RegionBlocks:
         """
         Extract text blocks from a page, with support for table-based layouts.
         
@@ -83,67 +474,68 @@ class RegionAnalyzer:
             page: PyMuPDF page object
 
         Returns:
-            List of block dictionaries
+            RegionBlocks with one entry per (virtual) block
         """
-        blocks = []
+        x0s, y0s, x1s, y1s, texts = [], [], [], [], []
         page_dict = page.get_text("dict")
         page_width = page.rect.width
 
         for block in page_dict["blocks"]:
             if block.get('type') == 0:  # Text block
-                # Extract text from lines
+                # Extract text from lines (stripped, non-empty)
                 text_lines = []
                 for line in block.get('lines', []):
-                    line_text = ""
-                    for span in line.get('spans', []):
-                        line_text += span.get('text', '')
-                    if line_text.strip():
-                        text_lines.append(line_text.strip())
+                    line_text = ''.join([span.get('text', '') for span in line.get('spans', [])]).strip()
+                    if line_text:
+                        text_lines.append(line_text)
 
+                # Lines are already stripped, so the joined text is too
                 text = '\n'.join(text_lines)
                 
                 # Check if this is a wide block (likely table-based)
-                block_width = block['bbox'][2] - block['bbox'][0]
+                x0, y0, x1, y1 = block['bbox']
+                block_width = x1 - x0
                 is_wide_block = block_width > (page_width * 0.5)  # >50% of page width
                 
-                if text.strip():
+                if text:
                     # Check if block contains mixed languages (table-based)
                     if is_wide_block and self._contains_multiple_languages(text):
                         # Split into virtual blocks by language, line-by-line
-                        virtual_blocks = self._split_table_block_line_by_line(block, text_lines)
-                        blocks.extend(virtual_blocks)
+                        for virtual in self._split_table_block_line_by_line(block, text_lines):
+                            x0s.append(virtual.x0)
+                            y0s.append(virtual.y0)
+                            x1s.append(virtual.x1)
+                            y1s.append(virtual.y1)
+                            texts.append(virtual.text)
                     else:
                         # Regular block
-                        blocks.append({
-                            'x0': block['bbox'][0],
-                            'y0': block['bbox'][1],
-                            'x1': block['bbox'][2],
-                            'y1': block['bbox'][3],
-                            'text': text.strip(),
-                            'width': block_width,
-                            'height': block['bbox'][3] - block['bbox'][1],
-                            'x_center': (block['bbox'][0] + block['bbox'][2]) / 2,
-                            'y_center': (block['bbox'][1] + block['bbox'][3]) / 2
-                        })
-
-        return blocks
+                        x0s.append(x0)
+                        y0s.append(y0)
+                        x1s.append(x1)
+                        y1s.append(y1)
+                        texts.append(text)
+
+        return RegionBlocks(
+            x0=np.asarray(x0s, dtype=np.float64),
+            y0=np.asarray(y0s, dtype=np.float64),
+            x1=np.asarray(x1s, dtype=np.float64),
+            y1=np.asarray(y1s, dtype=np.float64),
+            texts=texts
+        )
     
     def _contains_multiple_languages(self, text: str) -> bool:
         """
         Check if text contains multiple language markers indicating table-based layout.
         """
-        import re
-        
-        # Check for presence of markers from different languages
-        has_kinyarwanda = bool(re.search(r'(Ingingo ya|UMUTWE WA|Icyiciro cya|Komisiyo)', text))
-        has_english = bool(re.search(r'(Article (?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|\d+):|CHAPTER |Section (?:One|Two|Three|Four):|Commission)', text))
-        has_french = bool(re.search(r'(Article (?:premier|deuxième):|CHAPITRE |Section (?:première|deuxième):|Commission)', text))
-        
-        # If we have markers from 2+ languages, it's likely table-based
-        lang_count = sum([has_kinyarwanda, has_english, has_french])
-        return lang_count >= 2
+        # If we have markers from 2+ languages, it's likely table-based.
+        # Stop searching as soon as the outcome is decided.
+        if _KINY_MARKER_RE.search(text):
+            return bool(_ENG_MARKER_RE.search(text) or _FR_MARKER_RE.search(text))
+        return bool(_ENG_MARKER_RE.search(text) and _FR_MARKER_RE.search(text))
     
-    def _split_table_block_line_by_line(self, block: Dict, text_lines: List[str]) -> List[Dict]:
+    def _split_table_block_line_by_line(
+        self, block: Dict, text_lines: List[str]
+    ) -> List[TextBlock]:
         """
         Split table block by classifying EACH LINE individually by language.
         
@@ -153,8 +545,6 @@ class RegionAnalyzer:
         Line 2: French
         Line 3: Kinyarwanda...
         """
-        import re
-        
         x0, y0, x1, y1 = block['bbox']
         block_width = x1 - x0
         col_width = block_width / 3
@@ -179,22 +569,8 @@ class RegionAnalyzer:
             # Detect language by checking for characteristic words
             line_lower = line.lower()
             
-            # Count language-specific markers
-            kiny_score = 0
-            eng_score = 0
-            fr_score = 0
-            
-            # Kinyarwanda markers (including title words)
-            kiny_words = ['ingingo', 'umutwe', 'icyiciro', 'komisiyo', 'uburenganzira', 'bwa', 'ya', 'rya', 'cya', 'kwa', 'zihariye', 'rusange', 'ububasha', 'inshingano', 'itegeko', 'rigena', 'imiterere', 'imikorere', 'ibirimo', 'kuwa', 'ryo']
-            kiny_score = sum(2 for word in kiny_words if word in line_lower)  # Higher weight per word
-            
-            # English markers  
-            eng_words = ['article', 'chapter', 'section', 'commission', 'the', 'of', 'and', 'to', 'rights', 'powers', 'missions', 'special', 'ordinary']
-            eng_score = sum(1 for word in eng_words if f' {word} ' in f' {line_lower} ' or line_lower.startswith(word) or line_lower.endswith(word))
-            
-            # French markers
-            fr_words = ['article', 'chapitre', 'section', 'commission', 'la', 'le', 'de', 'et', 'des', 'droits', 'pouvoirs', 'missions', 'particulières', 'ordinaires']
-            fr_score = sum(1 for word in fr_words if f' {word} ' in f' {line_lower} ' or line_lower.startswith(word) or line_lower.endswith(word))
+            # Count language-specific markers (Kinyarwanda words weigh more)
+            kiny_score, eng_score, fr_score = _score_line_languages(line_lower)
             
             # Classify by highest score
             if kiny_score > eng_score and kiny_score > fr_score and kiny_score > 0:
@@ -210,7 +586,7 @@ class RegionAnalyzer:
                 lang_lines['english'].append(line)
             else:
                 # Fallback: detect by character patterns
-                has_special_chars = any(c in line for c in ["'", "'"])  # Kinyarwanda apostrophes
+                has_special_chars = "'" in line  # Kinyarwanda apostrophes
                 if has_special_chars:
                     lang_lines['kinyarwanda'].append(line)
                 else:
@@ -223,195 +599,62 @@ class RegionAnalyzer:
                 col_x0 = x0 + (idx * col_width)
                 col_x1 = col_x0 + col_width
                 
-                virtual_blocks.append({
-                    'x0': col_x0,
-                    'y0': y0,
-                    'x1': col_x1,
-                    'y1': y1,
-                    'text': '\n'.join(lang_lines[lang]),
-                    'width': col_width,
-                    'height': y1 - y0,
-                    'x_center': (col_x0 + col_x1) / 2,
-                    'y_center': (y0 + y1) / 2
-                })
+                virtual_blocks.append(TextBlock(
+                    x0=col_x0,
+                    y0=y0,
+                    x1=col_x1,
+                    y1=y1,
+                    text='\n'.join(lang_lines[lang])
+                ))
         
-        return virtual_blocks if virtual_blocks else [{
-            'x0': x0,
-            'y0': y0,
-            'x1': x1,
-            'y1': y1,
-            'text': '\n'.join(text_lines),
-            'width': block_width,
-            'height': y1 - y0,
-            'x_center': (x0 + x1) / 2,
-            'y_center': (y0 + y1) / 2
-        }]
+        return virtual_blocks if virtual_blocks else [TextBlock(
+            x0=x0,
+            y0=y0,
+            x1=x1,
+            y1=y1,
+            text='\n'.join(text_lines)
+        )]
     
-    def _split_table_block(self, block: Dict, text_lines: List[str]) -> List[Dict]:
-        """
-        Split a table-based block into virtual blocks for each language.
-        
-        For table-based PDFs where languages alternate line-by-line in the same block,
-        categorize each line by language and create separate virtual blocks.
-        """
-        import re
-        
-        x0, y0, x1, y1 = block['bbox']
-        block_width = x1 - x0
-        col_width = block_width / 3
-        
-        # Language patterns for classification
-        kiny_pattern = r'(Ingingo ya|UMUTWE WA|Icyiciro cya|Komisiyo|abakozi|ubufatanye|ry\'|by\'|cy\')'
-        eng_pattern = r'(Article (?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|\d+):|CHAPTER (?:I{1,3}|IV|V|VI{0,3}|IX|X|\d+)|Section (?:One|Two|Three|Four|Five):|the Commission|Commissioners)'
-        fr_pattern = r'(Article (?:premier|première|deuxième|troisième|\d+):|CHAPITRE (?:I{1,3}|IV|V|VI{0,3}|IX|X|\d+)|Section (?:première|deuxième):|la Commission|Commissaires)'
-        
-        # Classify each line by language
-        lang_texts = {'kinyarwanda': [], 'english': [], 'french': []}
-        
-        for line in text_lines:
-            if not line.strip():
-                continue
-                
-            line_stripped = line.strip()
-            
-            # Check if line contains markers from multiple languages (mixed line)
-            has_kiny = bool(re.search(kiny_pattern, line, re.IGNORECASE))
-            has_eng = bool(re.search(eng_pattern, line, re.IGNORECASE))
-            has_fr = bool(re.search(fr_pattern, line, re.IGNORECASE))
-            
-            lang_count = sum([has_kiny, has_eng, has_fr])
-            
-            if lang_count >= 2:
-                # Mixed line - split it
-                markers = []
-                for match in re.finditer(kiny_pattern, line, re.IGNORECASE):
-                    markers.append(('kinyarwanda', match.start()))
-                for match in re.finditer(eng_pattern, line, re.IGNORECASE):
-                    markers.append(('english', match.start()))
-                for match in re.finditer(fr_pattern, line, re.IGNORECASE):
-                    markers.append(('french', match.start()))
-                
-                markers.sort(key=lambda x: x[1])
-                
-                # Split by markers
-                for i, (lang, pos) in enumerate(markers):
-                    start = pos
-                    end = markers[i + 1][1] if i + 1 < len(markers) else len(line)
-                    segment = line[start:end].strip()
-                    if segment:
-                        lang_texts[lang].append(segment)
-            else:
-                # Single language line - classify it
-                if has_kiny:
-                    lang_texts['kinyarwanda'].append(line_stripped)
-                elif has_eng:
-                    lang_texts['english'].append(line_stripped)
-                elif has_fr:
-                    lang_texts['french'].append(line_stripped)
-                else:
-                    # Fallback: try to detect by common words
-                    line_lower = line_stripped.lower()
-                    if any(word in line_lower for word in ['article', 'chapter', 'section', 'commission', 'the', 'and', 'of']):
-                        lang_texts['english'].append(line_stripped)
-                    elif any(word in line_lower for word in ['ingingo', 'umutwe', 'icyiciro', 'komisiyo', 'ya', 'na']):
-                        lang_texts['kinyarwanda'].append(line_stripped)
-                    elif any(word in line_lower for word in ['chapitre', 'commissaires', 'la', 'le', 'de', 'et']):
-                        lang_texts['french'].append(line_stripped)
-                    else:
-                        # Default to english
-                        lang_texts['english'].append(line_stripped)
-        
-        # Create virtual blocks for languages with content
-        virtual_blocks = []
-        for idx, (lang, lines) in enumerate([('kinyarwanda', lang_texts['kinyarwanda']), 
-                                              ('english', lang_texts['english']), 
-                                              ('french', lang_texts['french'])]):
-            if lines:
-                col_x0 = x0 + (idx * col_width)
-                col_x1 = col_x0 + col_width
-                
-                virtual_blocks.append({
-                    'x0': col_x0,
-                    'y0': y0,
-                    'x1': col_x1,
-                    'y1': y1,
-                    'text': '\n'.join(lines),
-                    'width': col_width,
-                    'height': y1 - y0,
-                    'x_center': (col_x0 + col_x1) / 2,
-                    'y_center': (y0 + y1) / 2
-                })
-        
-        return virtual_blocks if virtual_blocks else [{
-            'x0': x0,
-            'y0': y0,
-            'x1': x1,
-            'y1': y1,
-            'text': '\n'.join(text_lines),
-            'width': block_width,
-            'height': y1 - y0,
-            'x_center': (x0 + x1) / 2,
-            'y_center': (y0 + y1) / 2
-        }]
-
-    def _detect_regions(self, blocks: List[Dict], page_height: float) -> List[Dict]:
+    def _detect_regions(self, blocks: RegionBlocks, page_height: float) -> List[Dict]:
         """
         Detect horizontal regions on the page.
 
         Uses vertical position clustering to identify natural breaks in content.
 
         Args:
-            blocks: List of text blocks
+            blocks: Text blocks of the page
             page_height: Height of the page
 
         Returns:
             List of region dictionaries
         """
-        if not blocks:
+        if not blocks.texts:
             return []
 
-        # Sort blocks by vertical position
-        sorted_blocks = sorted(blocks, key=lambda b: b['y0'])
-
-        # Find vertical gaps to identify region boundaries
-        regions = []
-        current_region_blocks = []
-        current_y_start = sorted_blocks[0]['y0']
-        previous_y_end = sorted_blocks[0]['y0']
-
-        for block in sorted_blocks:
-            gap = block['y0'] - previous_y_end
-
-            # If there's a significant gap, start a new region
-            if gap > self.min_region_height and current_region_blocks:
-                # Finalize current region
-                regions.append({
-                    'y_start': current_y_start,
-                    'y_end': previous_y_end,
-                    'blocks': current_region_blocks,
-                    'height': previous_y_end - current_y_start
-                })
-
-                # Start new region
-                current_region_blocks = [block]
-                current_y_start = block['y0']
-            else:
-                current_region_blocks.append(block)
+        # Sort blocks by vertical position (stable, like sorted())
+        order = np.argsort(blocks.y0, kind='stable')
 
-            previous_y_end = block['y1']
+        # A significant vertical gap between consecutive blocks starts a new region
+        gaps = blocks.y0[order[1:]] - blocks.y1[order[:-1]]
+        region_starts = np.flatnonzero(gaps > self.min_region_height) + 1
 
-        # Add the last region
-        if current_region_blocks:
+        regions = []
+        for region_order in np.split(order, region_starts):
+            y_start = float(blocks.y0[region_order[0]])
+            y_end = float(blocks.y1[region_order[-1]])
             regions.append({
-                'y_start': current_y_start,
-                'y_end': previous_y_end,
-                'blocks': current_region_blocks,
-                'height': previous_y_end - current_y_start
+                'y_start': y_start,
+                'y_end': y_end,
+                'blocks': _select_blocks(blocks, region_order),
+                'height': y_end - y_start
             })
 
         return regions
 
-    def _detect_region_layout(self, blocks: List[Dict]) -> Tuple[str, int]:
+    def _detect_region_layout(
+        self,
+        blocks: RegionBlocks
+    ) -> Tuple[str, int, Optional[np.ndarray]]:
         """
         Detect layout type for a specific region.
 
@@ -419,54 +662,55 @@ class RegionAnalyzer:
             blocks: Text blocks in the region
 
         Returns:
-            Tuple of (layout_type, num_columns)
+            Tuple of (layout_type, num_columns, column_labels), where
+            column_labels assigns each block a column (left to right) for
+            multi-column layouts and is None otherwise
         """
-        if not blocks:
-            return self.LAYOUT_SINGLE, 1
+        num_blocks = len(blocks.texts)
 
-        if len(blocks) < 2:
-            return self.LAYOUT_SINGLE, 1
+        if num_blocks < 2:
+            return self.LAYOUT_SINGLE, 1, None
 
         # Analyze x-position distribution to detect columns
-        x_centers = np.array([b['x_center'] for b in blocks])
+        x_centers = _x_centers(blocks)
+
+        # Blocks whose centres all lie within two column gaps of each other
+        # cannot form separate columns (cluster centres lie within the data
+        # range), so skip clustering altogether
+        if np.ptp(x_centers) <= self.min_column_gap * 2:
+            return self.LAYOUT_SINGLE, 1, None
 
         # Try to detect 2 columns first (most common)
-        if len(blocks) >= 4:
+        if num_blocks >= 4:
             # Use K-means with k=2 to see if there are distinct columns
-            kmeans = KMeans(n_clusters=2, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(x_centers.reshape(-1, 1))
-
-            # Calculate cluster centers
-            centers = kmeans.cluster_centers_.flatten()
+            labels, centers = _kmeans_1d(x_centers, 2)
             gap = abs(centers[0] - centers[1])
 
             # If gap is significant, we have columns
             if gap > self.min_column_gap * 2:
                 # Check if blocks are roughly evenly distributed
-                count0 = np.sum(labels == 0)
-                count1 = np.sum(labels == 1)
+                count0, count1 = np.bincount(labels, minlength=2)
 
                 # If one column has significantly more blocks, might not be true columns
                 ratio = min(count0, count1) / max(count0, count1)
 
                 if ratio > 0.3:  # At least 30% balance
-                    return self.LAYOUT_COLUMNS, 2
+                    return self.LAYOUT_COLUMNS, 2, labels
 
         # Try 3 columns (less common)
-        if len(blocks) >= 6:
-            kmeans = KMeans(n_clusters=3, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(x_centers.reshape(-1, 1))
+        if num_blocks >= 6:
+            labels, _ = _kmeans_1d(x_centers, 3)
 
             # Check distribution balance
-            counts = [np.sum(labels == i) for i in range(3)]
-            min_count = min(counts)
-            max_count = max(counts)
+            counts = np.bincount(labels, minlength=3)
+            min_count = counts.min()
+            max_count = counts.max()
 
             if min_count / max_count > 0.25:  # Reasonable balance
-                return self.LAYOUT_COLUMNS, 3
+                return self.LAYOUT_COLUMNS, 3, labels
 
         # Default to single column
-        return self.LAYOUT_SINGLE, 1
+        return self.LAYOUT_SINGLE, 1, None
 
     def extract_region_text(
         self,
@@ -488,67 +732,96 @@ class RegionAnalyzer:
         num_columns = region['num_columns']
 
         if layout_type == self.LAYOUT_SINGLE:
-            # Single column - just combine all blocks
-            blocks_sorted = sorted(blocks, key=lambda b: (b['y0'], b['x0']))
-            text = '\n'.join(b['text'] for b in blocks_sorted)
+            # Single column - just combine all blocks in reading order
+            reading_order = _reading_order(blocks)
+            if reading_order is None:
+                text = '\n'.join(blocks.texts)
+            else:
+                text = '\n'.join([blocks.texts[i] for i in reading_order])
 
             # Detect language
             if language_detector:
-                language, _ = language_detector.detect_language(text)
+                language, _ = self._detect_language_cached(language_detector, text)
             else:
                 language = 'unknown'
 
             return {language: text}
 
         elif layout_type == self.LAYOUT_COLUMNS:
-            # Multi-column - cluster by x-position
-            x_centers = np.array([b['x_center'] for b in blocks]).reshape(-1, 1)
-
-            kmeans = KMeans(n_clusters=num_columns, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(x_centers)
-
-            # Sort cluster centers left to right
-            centers = kmeans.cluster_centers_.flatten()
-            sorted_cluster_ids = np.argsort(centers)
-
-            # Map cluster labels to column IDs
-            cluster_to_column = {old: new for new, old in enumerate(sorted_cluster_ids)}
-            column_assignments = [cluster_to_column[label] for label in labels]
-
-            # Group blocks by column
-            columns = {i: [] for i in range(num_columns)}
-            for block, col_id in zip(blocks, column_assignments):
-                columns[col_id].append(block)
-
-            # Extract text from each column
-            result = {}
-            for col_id in range(num_columns):
-                if columns[col_id]:
-                    col_blocks = sorted(columns[col_id], key=lambda b: (b['y0'], b['x0']))
-                    col_text = '\n'.join(b['text'] for b in col_blocks)
+            # Multi-column - reuse the clustering from layout detection when
+            # it matches, otherwise cluster by x-position
+            column_clusters = region.get('column_clusters')
+            if (column_clusters is not None and column_clusters[0] == num_columns
+                    and len(column_clusters[1]) == len(blocks.texts)):
+                column_assignments = column_clusters[1]
+            else:
+                # Cluster ids are already ordered left to right
+                column_assignments, _ = _kmeans_1d(_x_centers(blocks), num_columns)
+
+            # Group blocks by column with one stable sort, which keeps the
+            # reading order within each column
+            reading_order = _reading_order(blocks)
+            if reading_order is None:
+                reading_order = np.arange(len(blocks.texts))
+            column_order = reading_order[
+                np.argsort(column_assignments[reading_order], kind='stable')
+            ]
+            column_sizes = np.bincount(column_assignments, minlength=num_columns)
+            columns = np.split(column_order, np.cumsum(column_sizes)[:-1])
+
+            # Extract text from each column (collect parts, join once per language)
+            result = defaultdict(list)
+            for col_indices in columns:
+                if len(col_indices):
+                    col_text = '\n'.join([blocks.texts[i] for i in col_indices])
 
                     # Detect language
                     if language_detector and col_text.strip():
-                        language, confidence = language_detector.detect_language(col_text)
+                        language, confidence = self._detect_language_cached(
+                            language_detector, col_text
+                        )
                         # Lower threshold - accept more results
                         if confidence > 0.3 or language != 'unknown':
-                            if language in result:
-                                result[language] += '\n\n' + col_text
-                            else:
-                                result[language] = col_text
+                            result[language].append(col_text)
                         else:
                             # Even if confidence is low, keep the text as 'unknown'
-                            if 'unknown' in result:
-                                result['unknown'] += '\n\n' + col_text
-                            else:
-                                result['unknown'] = col_text
+                            result['unknown'].append(col_text)
                     elif col_text.strip():
                         # No detector, but we have text
-                        if 'unknown' in result:
-                            result['unknown'] += '\n\n' + col_text
-                        else:
-                            result['unknown'] = col_text
+                        result['unknown'].append(col_text)
 
-            return result if result else {'unknown': '\n\n'.join(b['text'] for b in blocks)}
+            if not result:
+                return {'unknown': '\n\n'.join(blocks.texts)}
+            return {language: '\n\n'.join(parts) for language, parts in result.items()}
 
         return {}
+
+    def _detect_language_cached(self, language_detector, text: str) -> Tuple[str, float]:
+        """
+        Detect the language of region text, reusing earlier results.
+
+        Results are keyed on the detector and the exact text, so a repeated
+        header or column fragment is only analyzed once per detector.
+
+        Args:
+            language_detector: LanguageDetector instance
+            text: Text to analyze
+
+        Returns:
+            Tuple of (language_name, confidence_score)
+        """
+        if len(text) > self.DETECTION_CACHE_MAX_LEN:
+            return language_detector.detect_language(text)
+
+        cache = self._detection_cache
+        key = (language_detector, text)
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
+        result = language_detector.detect_language(text)
+        cache[key] = result
+        if len(cache) > self.DETECTION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
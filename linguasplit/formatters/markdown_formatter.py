@@ -4,11 +4,120 @@ Converts extracted text to well-formatted Markdown with metadata.
 """
 
 import re
+import time
 from datetime import datetime
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
 from .text_cleaner import TextCleaner
 
 
+# Classifies a line for _format_content in one match. Alternatives are tried
+# in order, so earlier kinds take precedence; match.lastgroup names the kind.
+_LINE_KIND_RE = re.compile(
+    r'(?P<heading>(?i:Article|Ingingo)\s+\w+:)'  # Article / Ingingo headings
+    r'|(?P<degree_item>(?P<degree>\d+)°\s+(?P<degree_body>.*))'  # 1°, 2°, 3°
+    r'|(?P<letter_item>(?P<letter>[a-z])\)\s+(?P<letter_body>.*))'  # a), b), c)
+    r'|(?P<section>(?i:CHAPTER|Section|TABLE OF CONTENTS))'
+    r'|(?P<law>LAW|DECREE|Presidential Order|Pursuant to)'
+)
+# First characters any _LINE_KIND_RE alternative can match besides decimal
+# digits (including the non-ASCII case-insensitive matches of i and s)
+_LINE_KIND_FIRST_CHARS = frozenset(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz\u0130\u0131\u017f'
+)
+
+# Heading and list detection patterns
+_LIST_MARKER_RE = re.compile(r'^\d+[°\)]')
+_LETTER_MARKER_RE = re.compile(r'^[a-z]\)')
+_NUMBERED_MARKER_RE = re.compile(r'^\d+\.')
+_NUMBERED_HEADING_PATTERNS = [
+    re.compile(
+        r'^(?:Chapter|Section|Part|Article|Chapitre|Ingingo|UMUTWE)\s+(?:ya\s+)?(?:\d+|One|premier|ya mbere)',
+        re.IGNORECASE
+    ),  # "Chapter 1", "Article 5", "Ingingo ya 1"
+    re.compile(r'^[IVXLCDM]+\.\s+[A-Z]', re.IGNORECASE),  # Roman numerals followed by text "I. Introduction"
+    re.compile(r'^(?:LAW|ITEGEKO|LOI)\s+N[°º]', re.IGNORECASE),  # "LAW N° 61/2018"
+]
+_NUMBERING_RE = re.compile(r'^(\d+(?:\.\d+)*)')
+_SECTION_MARKERS = frozenset({
+    'introduction',
+    'abstract',
+    'summary',
+    'conclusion',
+    'references',
+    'bibliography',
+    'appendix',
+    'annexe',
+    'résumé',
+})
+_MAX_SECTION_MARKER_LEN = max(map(len, _SECTION_MARKERS))
+_LIST_ITEM_PATTERNS = [
+    re.compile(r'^\d+[°\)]\s+'),  # "1° ", "2) "
+    re.compile(r'^[a-z]\)\s+'),    # "a) ", "b) "
+    re.compile(r'^\d+\.\s+'),      # "1. ", "2. "
+]
+
+# Markdown heading and anchor patterns
+_MARKDOWN_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_ANCHOR_STRIP_RE = re.compile(r'[^\w\s-]')
+_ANCHOR_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+
+def _is_caps_title(line: str) -> bool:
+    """
+    Check if a line is an ALL CAPS title of at least three words.
+
+    Accepts exactly the lines of 11+ characters made of A-Z and whitespace
+    (starting with a letter), using only linear str scans.
+
+    Args:
+        line: Stripped line to check
+
+    Returns:
+        True if the line is an ALL CAPS title
+    """
+    # isupper() rejects most lines without allocating
+    if len(line) <= 10 or not 'A' <= line[0] <= 'Z' or not line.isupper():
+        return False
+
+    # split() uses the same whitespace set as \s in str patterns
+    words = line.split()
+    if len(words) <= 2:
+        return False
+
+    letters = ''.join(words)
+    return letters.isascii() and letters.isalpha()
+
+
+def _metadata_end_line(text: str) -> int:
+    """
+    Find the line index just past the closing "---" of a metadata block.
+
+    Only lines containing "---" are inspected, located with str.find
+    rather than by walking every line.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        Index of the line after the second delimiter line, or 0 if the
+        text has fewer than two
+    """
+    seen_opening = False
+    pos = text.find('---')
+    while pos != -1:
+        start = text.rfind('\n', 0, pos) + 1
+        end = text.find('\n', pos)
+        if end == -1:
+            end = len(text)
+        if text[start:end].strip() == '---':
+            if seen_opening:
+                return text.count('\n', 0, start) + 1
+            seen_opening = True
+        pos = text.find('---', end)
+    return 0
+
+
 class MarkdownFormatter:
     """
     Formats extracted text as Markdown with metadata and structure.
@@ -32,6 +141,8 @@ class MarkdownFormatter:
         self.include_metadata = include_metadata
         self.include_page_markers = include_page_markers
         self.text_cleaner = TextCleaner(preserve_structure=True)
+        # (epoch second, formatted generation date) of the last header
+        self._generated_stamp: Optional[Tuple[int, str]] = None
 
     def format_document(
         self,
@@ -68,9 +179,9 @@ class MarkdownFormatter:
                 markdown_parts.append(header)
                 markdown_parts.append("")  # Blank line after metadata
 
-        # Process text to detect and format structure
-        formatted_text = self._format_content(text, page_breaks)
-        markdown_parts.append(formatted_text)
+        # Process text to detect and format structure, joining the
+        # formatted lines together with the header in one pass
+        markdown_parts.extend(self._format_lines(text) or [""])
 
         return "\n".join(markdown_parts)
 
@@ -110,7 +221,7 @@ class MarkdownFormatter:
             lines.append(f"language: {language}")
 
         # Add generation date
-        lines.append(f"generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"generated: {self._generation_date()}")
         lines.append(f"tool: LinguaSplit")
 
         lines.append("---")
@@ -131,84 +242,81 @@ class MarkdownFormatter:
         Returns:
             Formatted markdown text
         """
-        if not text:
-            return ""
-        
-        import re
-        
-        # Split into paragraphs (double newlines)
-        paragraphs = text.split('\n\n')
-        formatted_paragraphs = []
+        return '\n'.join(self._format_lines(text))
+
+    def _format_lines(self, text: str) -> List[str]:
+        """
+        Format content into output lines, with an empty line between paragraphs.
+
+        Args:
+            text: Text to format
+
+        Returns:
+            Formatted markdown lines, to be joined with newlines
+        """
+        # An empty line (from a double newline) ends a paragraph; lines of
+        # only whitespace are skipped within it. Formatted lines are never
+        # empty, so '' in the output marks a paragraph break.
+        formatted_lines = []
         
-        for para in paragraphs:
-            if not para.strip():
+        for line in text.split('\n'):
+            if not line:
+                if formatted_lines and formatted_lines[-1]:
+                    formatted_lines.append('')
+                continue
+            if line.isspace():
+                continue
+            
+            line = line.strip()
+            
+            # Detect and format different types of content
+            
+            # 1. ALL CAPS titles (but not single words)
+            if _is_caps_title(line):
+                formatted_lines.append(f"## {line}")
+                continue
+            
+            # Lines that cannot start any other kind are regular text
+            first_char = line[0]
+            match = None
+            if first_char in _LINE_KIND_FIRST_CHARS or first_char.isdecimal():
+                match = _LINE_KIND_RE.match(line)
+            kind = match.lastgroup if match else None
+            
+            # 2-3. Article headings and Ingingo headings (Kinyarwanda)
+            if kind == 'heading':
+                formatted_lines.append(f"### {line}")
+                continue
+            
+            # 4. Numbered lists with degree symbol (1°, 2°, 3°)
+            if kind == 'degree_item':
+                formatted_lines.append(f"{match['degree']}. {match['degree_body']}")
                 continue
             
-            lines = para.split('\n')
-            formatted_lines = []
+            # 5. Lettered lists (a), b), c))
+            if kind == 'letter_item':
+                # Convert letter to number (a=1, b=2, etc)
+                num = ord(match['letter']) - ord('a') + 1
+                formatted_lines.append(f"   {num}. {match['letter_body']}")  # Indent sub-lists
+                continue
+            
+            # 6. Section headings (CHAPTER, Section, TABLE OF CONTENTS)
+            if kind == 'section':
+                formatted_lines.append(f"## {line}")
+                continue
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Detect and format different types of content
-                
-                # 1. ALL CAPS titles (but not single words)
-                if re.match(r'^[A-Z][A-Z\s]{10,}$', line) and len(line.split()) > 2:
-                    formatted_lines.append(f"## {line}")
-                    continue
-                
-                # 2. Article headings
-                if re.match(r'^Article\s+\w+:', line, re.IGNORECASE):
-                    formatted_lines.append(f"### {line}")
-                    continue
-                
-                # 3. Ingingo headings (Kinyarwanda)
-                if re.match(r'^Ingingo\s+\w+:', line, re.IGNORECASE):
-                    formatted_lines.append(f"### {line}")
-                    continue
-                
-                # 4. Numbered lists with degree symbol (1°, 2°, 3°)
-                if re.match(r'^(\d+)°\s+', line):
-                    # Extract number and content
-                    match = re.match(r'^(\d+)°\s+(.*)', line)
-                    if match:
-                        num, content = match.groups()
-                        formatted_lines.append(f"{num}. {content}")
-                        continue
-                
-                # 5. Lettered lists (a), b), c))
-                if re.match(r'^([a-z])\)\s+', line):
-                    # Extract letter and content
-                    match = re.match(r'^([a-z])\)\s+(.*)', line)
-                    if match:
-                        letter, content = match.groups()
-                        # Convert letter to number (a=1, b=2, etc)
-                        num = ord(letter) - ord('a') + 1
-                        formatted_lines.append(f"   {num}. {content}")  # Indent sub-lists
-                        continue
-                
-                # 6. Section headings (CHAPTER, Section, TABLE OF CONTENTS)
-                if re.match(r'^(CHAPTER|Section|TABLE OF CONTENTS)', line, re.IGNORECASE):
-                    formatted_lines.append(f"## {line}")
-                    continue
-                
-                # 7. Law/decree references at start
-                if re.match(r'^(LAW|DECREE|Presidential Order|Pursuant to)', line):
-                    formatted_lines.append(f"**{line}**")
-                    continue
-                
-                # 8. Regular text
-                formatted_lines.append(line)
+            # 7. Law/decree references at start
+            if kind == 'law':
+                formatted_lines.append(f"**{line}**")
+                continue
             
-            if formatted_lines:
-                formatted_paragraphs.append('\n'.join(formatted_lines))
+            # 8. Regular text
+            formatted_lines.append(line)
         
-        # Join paragraphs with double newline
-        result = '\n\n'.join(formatted_paragraphs)
+        if formatted_lines and not formatted_lines[-1]:
+            formatted_lines.pop()
         
-        return result
+        return formatted_lines
 
     def _detect_heading(self, line: str, line_idx: int, all_lines: List[str]) -> int:
         """
@@ -227,7 +335,7 @@ class MarkdownFormatter:
             return 0
 
         # Skip lines that are clearly list items (start with number + ° or letter + ))
-        if re.match(r'^\d+[°\)]', line) or re.match(r'^[a-z]\)', line):
+        if _LIST_MARKER_RE.match(line) or _LETTER_MARKER_RE.match(line):
             return 0
 
         # Check for numbered section headings (e.g., "Article 1", "Chapter 1", "Ingingo ya 1")
@@ -264,14 +372,8 @@ class MarkdownFormatter:
             True if numbered heading
         """
         # Only match Article/Chapter/Section headings, not list items
-        patterns = [
-            r'^(Chapter|Section|Part|Article|Chapitre|Ingingo|UMUTWE)\s+(ya\s+)?(\d+|One|premier|ya mbere)',  # "Chapter 1", "Article 5", "Ingingo ya 1"
-            r'^[IVXLCDM]+\.\s+[A-Z]',  # Roman numerals followed by text "I. Introduction"
-            r'^(LAW|ITEGEKO|LOI)\s+N[°º]',  # "LAW N° 61/2018"
-        ]
-
-        for pattern in patterns:
-            if re.match(pattern, line, re.IGNORECASE):
+        for pattern in _NUMBERED_HEADING_PATTERNS:
+            if pattern.match(line):
                 return True
 
         return False
@@ -287,7 +389,7 @@ class MarkdownFormatter:
             Depth level (1-6)
         """
         # Count dots in numbering (e.g., "1.2.3" = depth 3)
-        match = re.match(r'^(\d+(?:\.\d+)*)', line)
+        match = _NUMBERING_RE.match(line)
         if match:
             numbering = match.group(1)
             depth = numbering.count('.') + 1
@@ -306,19 +408,32 @@ class MarkdownFormatter:
         Returns:
             True if all caps heading
         """
-        # Must have at least some letters
-        if not any(c.isalpha() for c in line):
-            return False
-
-        # Check if all letters are uppercase
-        letters = [c for c in line if c.isalpha()]
-        if not letters:
+        # Not too long, and not when every cased letter is lowercase
+        if len(line) > 100 or line.islower():
             return False
 
-        uppercase_ratio = sum(1 for c in letters if c.isupper()) / len(letters)
+        # Every ASCII letter uppercase
+        if line.isascii() and line.isupper():
+            return True
+
+        # Count uppercase and other letters in one pass
+        uppercase = other = 0
+        remaining = len(line)
+        for c in line:
+            remaining -= 1
+            if c.isalpha():
+                if c.isupper():
+                    uppercase += 1
+                else:
+                    other += 1
+                    # Stop once 90% is out of reach even if every remaining
+                    # character were an uppercase letter
+                    if uppercase + remaining < 9 * other:
+                        return False
 
-        # At least 90% uppercase and not too long
-        return uppercase_ratio >= 0.9 and len(line) <= 100
+        # Must have at least some letters, at least 90% uppercase
+        letters = uppercase + other
+        return letters > 0 and uppercase / letters >= 0.9
 
     def _is_title_case(self, line: str) -> bool:
         """
@@ -330,12 +445,13 @@ class MarkdownFormatter:
         Returns:
             True if title case
         """
-        words = line.split()
+        # Splitting stops once a 16th word shows the line is too long
+        words = line.split(maxsplit=15)
         if len(words) < 2 or len(words) > 15:
             return False
 
         # Check if most words start with capital letter
-        capitalized = sum(1 for word in words if word[0].isupper())
+        capitalized = sum([word[0].isupper() for word in words])
         ratio = capitalized / len(words)
 
         # Allow for articles and prepositions
@@ -351,20 +467,11 @@ class MarkdownFormatter:
         Returns:
             True if section marker
         """
-        markers = [
-            'introduction',
-            'abstract',
-            'summary',
-            'conclusion',
-            'references',
-            'bibliography',
-            'appendix',
-            'annexe',
-            'résumé',
-        ]
-
-        line_lower = line.lower().strip()
-        return line_lower in markers
+        # lower() never shortens a string, so longer lines cannot match
+        stripped = line.strip()
+        if len(stripped) > _MAX_SECTION_MARKER_LEN:
+            return False
+        return stripped.lower() in _SECTION_MARKERS
 
     def _is_list_item(self, line: str) -> bool:
         """
@@ -376,14 +483,8 @@ class MarkdownFormatter:
         Returns:
             True if list item
         """
-        patterns = [
-            r'^\d+[°\)]\s+',  # "1° ", "2) "
-            r'^[a-z]\)\s+',   # "a) ", "b) "
-            r'^\d+\.\s+',     # "1. ", "2. "
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, line):
+        for pattern in _LIST_ITEM_PATTERNS:
+            if pattern.match(line):
                 return True
         
         return False
@@ -406,14 +507,14 @@ class MarkdownFormatter:
         prefix = "- "
         
         # For numbered items like "1°", "2)", keep them as-is but ensure spacing
-        if re.match(r'^\d+[°\)]', line):
+        if _LIST_MARKER_RE.match(line):
             prefix = "- "
         # For lettered items like "a)", "b)", keep them as-is
-        elif re.match(r'^[a-z]\)', line):
+        elif _LETTER_MARKER_RE.match(line):
             indent = "  "  # Indent sub-items
             prefix = "- "
         # For regular numbered lists "1.", "2."
-        elif re.match(r'^\d+\.', line):
+        elif _NUMBERED_MARKER_RE.match(line):
             prefix = "- "
         
         formatted = f"{indent}{prefix}{line}"
@@ -437,7 +538,7 @@ class MarkdownFormatter:
 
         # Extract headings
         for line in lines:
-            match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            match = _MARKDOWN_HEADING_RE.match(line)
             if match:
                 level = len(match.group(1))
                 title = match.group(2)
@@ -456,24 +557,21 @@ class MarkdownFormatter:
         toc_lines.append("")
 
         # Find where to insert TOC (after metadata)
-        insert_idx = 0
-        in_metadata = False
-        for i, line in enumerate(lines):
-            if line.strip() == "---":
-                if not in_metadata:
-                    in_metadata = True
-                else:
-                    insert_idx = i + 1
-                    break
+        insert_idx = _metadata_end_line(text)
 
         # Insert TOC
         result_lines = lines[:insert_idx] + toc_lines + lines[insert_idx:]
         return "\n".join(result_lines)
 
-    def _create_anchor(self, title: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _create_anchor(title: str) -> str:
         """
         Create URL-safe anchor from heading title.
 
+        Memoized, since documents repeat headings and the table of contents
+        may be built more than once.
+
         Args:
             title: Heading title
 
@@ -484,16 +582,33 @@ class MarkdownFormatter:
         anchor = title.lower()
 
         # Remove special characters
-        anchor = re.sub(r'[^\w\s-]', '', anchor)
+        anchor = _ANCHOR_STRIP_RE.sub('', anchor)
 
         # Replace spaces with hyphens
-        anchor = re.sub(r'[-\s]+', '-', anchor)
+        anchor = _ANCHOR_SEPARATOR_RE.sub('-', anchor)
 
         # Remove leading/trailing hyphens
         anchor = anchor.strip('-')
 
         return anchor
 
+    def _generation_date(self) -> str:
+        """
+        Get the current local time formatted for the metadata header.
+
+        The formatted string is reused for every header generated within
+        the same second (e.g. each language of a batch-processed document).
+
+        Returns:
+            Date and time as 'YYYY-MM-DD HH:MM:SS'
+        """
+        second = int(time.time())
+        stamp = self._generated_stamp
+        if stamp is None or stamp[0] != second:
+            stamp = (second, datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S'))
+            self._generated_stamp = stamp
+        return stamp[1]
+
     def format_with_columns(self, columns: List[str], metadata: Optional[Dict] = None) -> str:
         """
         Format multi-column text as Markdown.
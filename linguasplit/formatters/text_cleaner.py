@@ -7,6 +7,60 @@ import re
 from typing import Optional
 
 
+# Whitespace normalization patterns
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+_EXCESS_PARAGRAPH_BREAKS_RE = re.compile(r'\n{3,}')
+_MULTI_LINE_BREAK_RE = re.compile(r'\n{2,}')
+
+# Line break repair patterns
+_HYPHENATED_BREAK_RE = re.compile(r'-\n(\w)')
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+_NEW_ITEM_RE = re.compile(r'^(\d+°|[a-z]\)|Article\s+\d+:|Ingingo\s+)')
+_CLAUSE_END_CHARS = (';', ':', '.')
+_CONTINUATION_WORD_RE = re.compile(
+    r'^(and|or|of|by|in|to|the|for|with|as|on|from)\s', re.IGNORECASE
+)
+
+# Single-character substitutions, each applied in one str.translate pass
+_ARTIFACT_CHARS_TABLE = str.maketrans({
+    '\u200b': None,  # Zero-width space
+    '\u200c': None,  # Zero-width non-joiner
+    '\u200d': None,  # Zero-width joiner
+    '\ufeff': None,  # Byte order mark
+    '\f': '\n\n',   # Form feed
+})
+_QUOTES_TABLE = str.maketrans({
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+    '\u2018': "'",  # Left single quote
+    '\u2019': "'",  # Right single quote
+    '\u2033': '"',  # Double prime
+})
+# The artifact patterns never touch quote characters, so clean_text can
+# normalize quotes in the same pass as the artifact characters
+_ARTIFACT_AND_QUOTES_TABLE = {**_ARTIFACT_CHARS_TABLE, **_QUOTES_TABLE}
+
+# PDF extraction artifact patterns
+_ELLIPSIS_RUN_RE = re.compile(r'\.{4,}')
+_DASH_RUN_RE = re.compile(r'-{3,}')
+_STRAY_BAR_RE = re.compile(r'\|(?=\s|$)')
+_LONE_LOWERCASE_L_RE = re.compile(r'(?<=\s)l(?=\s)')
+
+# Language-detection cleanup patterns. The URL body is one character class
+# (letters, digits and !$%&'()*+,-./:;<=>?@[\]^_): nothing follows it, so
+# its greedy run is final and there is no alternation to backtrack through.
+_URL_RE = re.compile(r'https?://[!$-_a-z]+')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_STANDALONE_NUMBER_RE = re.compile(r'\b\d+\b')
+_NON_LINGUISTIC_RE = re.compile(r'[^a-zA-Z\u0080-\uFFFF\s.,!?;:\'-]')
+# The same filter for ASCII-only text: every ASCII character the pattern
+# above would replace, mapped to a space
+_NON_LINGUISTIC_ASCII_TABLE = str.maketrans({
+    chr(code): ' ' for code in range(128)
+    if _NON_LINGUISTIC_RE.fullmatch(chr(code))
+})
+
+
 class TextCleaner:
     """
     Utilities for cleaning and preprocessing extracted text.
@@ -37,11 +91,13 @@ class TextCleaner:
         if not text:
             return ""
 
-        # Apply cleaning steps in order
-        text = self.normalize_whitespace(text)
-        text = self.fix_line_breaks(text)
-        text = self.remove_artifacts(text)
-        text = self.normalize_quotes(text)
+        # Apply cleaning steps in order (artifact characters and quotes are
+        # replaced together in one pass). The unguarded step bodies are
+        # called directly: each handles an empty string already.
+        text = self._normalize_whitespace(text)
+        text = self._fix_line_breaks(text)
+        text = text.translate(_ARTIFACT_AND_QUOTES_TABLE)
+        text = self._remove_artifact_patterns(text)
 
         return text.strip()
 
@@ -58,8 +114,22 @@ class TextCleaner:
         if not text:
             return ""
 
-        # Replace multiple spaces with single space
-        text = re.sub(r' {2,}', ' ', text)
+        return self._normalize_whitespace(text)
+
+    def _normalize_whitespace(self, text: str) -> str:
+        """
+        Normalize whitespace (without the empty-text guard).
+
+        Args:
+            text: Text to normalize
+
+        Returns:
+            Text with normalized whitespace
+        """
+        # Replace multiple spaces with single space. The substring checks
+        # are much cheaper than a regex pass that finds nothing to replace.
+        if '  ' in text:
+            text = _MULTI_SPACE_RE.sub(' ', text)
 
         # Replace tabs with spaces
         text = text.replace('\t', ' ')
@@ -67,17 +137,14 @@ class TextCleaner:
         # Normalize line breaks (preserve paragraph breaks)
         if self.preserve_structure:
             # Keep double line breaks (paragraph separators)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-        else:
+            if '\n\n\n' in text:
+                text = _EXCESS_PARAGRAPH_BREAKS_RE.sub('\n\n', text)
+        elif '\n\n' in text:
             # Collapse all multiple line breaks
-            text = re.sub(r'\n{2,}', '\n', text)
+            text = _MULTI_LINE_BREAK_RE.sub('\n', text)
 
         # Remove spaces at start/end of lines
-        lines = text.split('\n')
-        lines = [line.strip() for line in lines]
-        text = '\n'.join(lines)
-
-        return text
+        return '\n'.join([line.strip() for line in text.split('\n')])
 
     def fix_line_breaks(self, text: str) -> str:
         """
@@ -94,49 +161,59 @@ class TextCleaner:
         if not text:
             return ""
 
+        return self._fix_line_breaks(text)
+
+    def _fix_line_breaks(self, text: str) -> str:
+        """
+        Fix line breaks (without the empty-text guard).
+
+        Args:
+            text: Text to fix
+
+        Returns:
+            Text with improved line breaks
+        """
         # Only fix hyphenated words at line end (word broken across lines)
-        text = re.sub(r'-\n(\w)', r'\1', text)
+        text = _HYPHENATED_BREAK_RE.sub(r'\1', text)
 
         # Split into paragraphs using double newlines (blank lines)
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
         result_paragraphs = []
         
         for para in paragraphs:
             lines = para.split('\n')
             para_lines = []
+            # Fragments of the line being built, joined once when it ends
+            current = []
             
             for line in lines:
                 line_stripped = line.strip()
                 if not line_stripped:
                     continue
                 
-                # Check if this line should be joined with previous
-                should_join = False
-                
-                if para_lines:
-                    prev_line = para_lines[-1]
-                    
-                    # Don't join if this line starts a new item
-                    starts_new_item = re.match(r'^(\d+°|[a-z]\)|Article\s+\d+:|Ingingo\s+)', line_stripped)
-                    
-                    # Don't join if previous line ends with punctuation
-                    prev_ends_punct = re.search(r'[;:.]$', prev_line)
-                    
+                # Check if this line should be joined with previous. Cheap
+                # tests come first so the regexes only run when they decide.
+                should_join = bool(
+                    current
+                    # Don't join if previous line (its last fragment) ends with punctuation
+                    and not current[-1].endswith(_CLAUSE_END_CHARS)
                     # Join if it's a continuation (lowercase or continuation word)
-                    starts_lowercase = line_stripped[0].islower()
-                    starts_continuation = re.match(r'^(and|or|of|by|in|to|the|for|with|as|on|from)\s', line_stripped, re.IGNORECASE)
-                    
-                    if not starts_new_item and not prev_ends_punct and (starts_lowercase or starts_continuation):
-                        should_join = True
+                    and (line_stripped[0].islower() or _CONTINUATION_WORD_RE.match(line_stripped))
+                    # Don't join if this line starts a new item
+                    and not _NEW_ITEM_RE.match(line_stripped)
+                )
                 
                 if should_join:
                     # Join with previous line
-                    para_lines[-1] = para_lines[-1] + ' ' + line_stripped
+                    current.append(line_stripped)
                 else:
                     # New line within paragraph
-                    para_lines.append(line_stripped)
+                    if current:
+                        para_lines.append(' '.join(current))
+                    current = [line_stripped]
             
-            if para_lines:
+            if current:
+                para_lines.append(' '.join(current))
                 result_paragraphs.append('\n'.join(para_lines))
         
         # Join paragraphs with double newline
@@ -155,19 +232,33 @@ class TextCleaner:
         if not text:
             return ""
 
-        # Remove zero-width spaces and other invisible characters
-        text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', text)
+        # Remove zero-width spaces and other invisible characters,
+        # and turn form feeds into paragraph breaks
+        text = text.translate(_ARTIFACT_CHARS_TABLE)
+
+        return self._remove_artifact_patterns(text)
+
+    def _remove_artifact_patterns(self, text: str) -> str:
+        """
+        Remove punctuation runs and OCR artifacts (after character cleanup).
 
-        # Remove form feed characters
-        text = text.replace('\f', '\n\n')
+        Args:
+            text: Text to clean
 
-        # Remove excessive punctuation artifacts (e.g., "......")
-        text = re.sub(r'\.{4,}', '...', text)
-        text = re.sub(r'-{3,}', '---', text)
+        Returns:
+            Text without artifacts
+        """
+        # Remove excessive punctuation artifacts (e.g., "......"); most
+        # pages have none, so a substring check skips the regex scan
+        if '....' in text:
+            text = _ELLIPSIS_RUN_RE.sub('...', text)
+        if '---' in text:
+            text = _DASH_RUN_RE.sub('---', text)
 
         # Remove common OCR artifacts
-        text = re.sub(r'\|(?=\s|$)', '', text)  # Stray vertical bars
-        text = re.sub(r'(?<=\s)l(?=\s)', 'I', text)  # Lowercase L as I
+        if '|' in text:
+            text = _STRAY_BAR_RE.sub('', text)  # Stray vertical bars
+        text = _LONE_LOWERCASE_L_RE.sub('I', text)  # Lowercase L as I
 
         return text
 
@@ -184,16 +275,8 @@ class TextCleaner:
         if not text:
             return ""
 
-        # Replace smart quotes with straight quotes
-        text = text.replace('\u201c', '"')  # Left double quote
-        text = text.replace('\u201d', '"')  # Right double quote
-        text = text.replace('\u2018', "'")  # Left single quote
-        text = text.replace('\u2019', "'")  # Right single quote
-
-        # Replace double prime with double quote
-        text = text.replace('\u2033', '"')
-
-        return text
+        # Replace smart quotes and double primes with straight quotes
+        return text.translate(_QUOTES_TABLE)
 
     def remove_headers_footers(self, text: str, patterns: Optional[list] = None) -> str:
         """
@@ -310,18 +393,22 @@ class TextCleaner:
             return ""
 
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', ' ', text)
+        text = _URL_RE.sub(' ', text)
 
         # Remove email addresses
-        text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', ' ', text)
+        text = _EMAIL_RE.sub(' ', text)
 
         # Remove standalone numbers
-        text = re.sub(r'\b\d+\b', ' ', text)
+        text = _STANDALONE_NUMBER_RE.sub(' ', text)
 
-        # Keep letters and basic punctuation only
-        text = re.sub(r'[^a-zA-Z\u0080-\uFFFF\s.,!?;:\'-]', ' ', text)
+        # Keep letters and basic punctuation only. str.translate is much
+        # faster on ASCII-only text but slower than the regex otherwise.
+        if text.isascii():
+            text = text.translate(_NON_LINGUISTIC_ASCII_TABLE)
+        else:
+            text = _NON_LINGUISTIC_RE.sub(' ', text)
 
         # Normalize whitespace
-        text = self.normalize_whitespace(text)
+        text = self._normalize_whitespace(text)
 
         return text
@@ -2,12 +2,20 @@
 LinguaSplit GUI package.
 
 Provides graphical user interface components for PDF processing.
+Submodules are imported on first attribute access, so importing one
+module of the package does not load every window and dialog.
 """
 
-from .main_window import LinguaSplitMainWindow, main
-from .settings_dialog import SettingsDialog
-from .preview_dialog import PreviewDialog
-from .summary_dialog import SummaryDialog
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'LinguaSplitMainWindow': '.main_window',
+    'SettingsDialog': '.settings_dialog',
+    'PreviewDialog': '.preview_dialog',
+    'SummaryDialog': '.summary_dialog',
+    'main': '.main_window',
+}
 
 __all__ = [
     'LinguaSplitMainWindow',
@@ -16,3 +24,12 @@ __all__ = [
     'SummaryDialog',
     'main'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,30 @@
 """
 GUI components package.
 
-Reusable widgets for the LinguaSplit interface.
+Reusable widgets for the LinguaSplit interface. Widget modules are
+imported on first attribute access.
 """
 
-from .file_list import FileListWidget
-from .log_viewer import LogViewerWidget
-from .progress_bar import ProgressBarWidget
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'FileListWidget': '.file_list',
+    'LogViewerWidget': '.log_viewer',
+    'ProgressBarWidget': '.progress_bar',
+}
 
 __all__ = [
     'FileListWidget',
     'LogViewerWidget',
     'ProgressBarWidget'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,36 @@
 File list widget with checkboxes, size, and status display.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk
-from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import compress
 from typing import List, Dict, Callable, Optional
 
+# Tree columns, in the order of each row's values
+_COLUMNS = ("filename", "size", "status")
+
+# File status values, shared by every row that shows them
+STATUS_PENDING = "Pending"
+STATUS_PROCESSING = "Processing"
+STATUS_SUCCESS = "Success"
+STATUS_ERROR = "Error"
+
+# Checkbox glyphs and row tag tuples, shared by every row
+_CHECKBOX_ON = "☑"
+_CHECKBOX_OFF = "☐"
+_TAGS_CHECKED = ("checked",)
+_TAGS_UNCHECKED = ("unchecked",)
+_STATUS_TAGS = {
+    STATUS_SUCCESS: ("checked", "success"),
+    STATUS_ERROR: ("checked", "error"),
+    STATUS_PROCESSING: ("checked", "processing"),
+}
+
+# Shared pool for file size lookups, so slow filesystems do not block the
+# Tk thread (capped to avoid flooding network drives with requests)
+_STAT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="linguasplit-stat")
 
 class FileListWidget(ttk.Frame):
     """
@@ -18,8 +43,18 @@ class FileListWidget(ttk.Frame):
     - Select all/deselect all functionality
     - Sort by different columns
     - Context menu for file operations
+
+    Rows are virtualized: the tree holds a fixed pool of items that are
+    refilled from the file model as the list scrolls, so rendering cost
+    depends on the number of visible rows rather than the number of files.
     """
 
+    # Number of pre-allocated tree items recycled while scrolling
+    ROW_POOL_SIZE = 60
+
+    # Fixed height of every tree row, in pixels
+    ROW_HEIGHT = 20
+
     def __init__(self, parent, on_selection_change: Optional[Callable] = None):
         """
         Initialize file list widget.
@@ -31,7 +66,21 @@ class FileListWidget(ttk.Frame):
         super().__init__(parent)
 
         self.on_selection_change = on_selection_change
-        self.files: Dict[str, Dict] = {}  # file_path -> file_info
+
+        # File model as parallel per-column arrays, indexed by row
+        self._paths: List[str] = []
+        self._filenames: List[str] = []
+        self._sizes: List[Optional[str]] = []  # None until looked up
+        self._status: List[str] = []
+        self._tags: List[tuple] = []
+        self._checked = bytearray()  # 1 if the file's checkbox is ticked
+        self._index: Dict[str, int] = {}  # file_path -> row
+        self._selected_paths = set()  # Paths highlighted in the tree
+
+        # Scroll window over the model (first row index, rows shown)
+        self._first_visible = 0
+        self._visible_rows = self.ROW_POOL_SIZE
+        self._attached_rows = 0
 
         self._create_widgets()
 
@@ -74,17 +123,24 @@ class FileListWidget(ttk.Frame):
         vsb = ttk.Scrollbar(tree_frame, orient="vertical")
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal")
 
-        # Treeview
+        # Uniform row height, so the visible row count follows directly
+        # from the tree height
+        style = ttk.Style(self)
+        style.configure("Files.Treeview", rowheight=self.ROW_HEIGHT)
+
+        # Treeview (vertical scrolling moves the window over the model,
+        # not the tree itself)
         self.tree = ttk.Treeview(
             tree_frame,
-            columns=("filename", "size", "status"),
+            columns=_COLUMNS,
             show="tree headings",
-            yscrollcommand=vsb.set,
+            style="Files.Treeview",
             xscrollcommand=hsb.set,
             selectmode="extended"
         )
 
-        vsb.config(command=self.tree.yview)
+        self.vsb = vsb
+        vsb.config(command=self._on_scroll)
         hsb.config(command=self.tree.xview)
 
         # Layout
@@ -109,6 +165,11 @@ class FileListWidget(ttk.Frame):
         # Bind events
         self.tree.bind("<Button-1>", self._on_click)
         self.tree.bind("<Double-Button-1>", self._on_double_click)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", self._on_tree_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self._scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll_rows(3))
 
         # Tags for styling
         self.tree.tag_configure("checked", foreground="black")
@@ -117,6 +178,12 @@ class FileListWidget(ttk.Frame):
         self.tree.tag_configure("error", foreground="red")
         self.tree.tag_configure("processing", foreground="blue")
 
+        # Pre-allocated rows, detached until there are files to show in them
+        self._row_ids = [self.tree.insert("", tk.END) for _ in range(self.ROW_POOL_SIZE)]
+        self._row_slots = {item_id: slot for slot, item_id in enumerate(self._row_ids)}
+        self._rendered_rows: List[Optional[tuple]] = [None] * self.ROW_POOL_SIZE
+        self.tree.detach(*self._row_ids)
+
     def add_files(self, file_paths: List[str]):
         """
         Add files to the list.
@@ -124,80 +191,86 @@ class FileListWidget(ttk.Frame):
         Args:
             file_paths: List of file paths to add
         """
-        for file_path in file_paths:
-            if file_path not in self.files:
-                path = Path(file_path)
-
-                # Get file size
-                try:
-                    size = path.stat().st_size
-                    size_str = self._format_size(size)
-                except:
-                    size_str = "Unknown"
-
-                # Add to tree
-                item_id = self.tree.insert(
-                    "",
-                    tk.END,
-                    text="☑",
-                    values=(path.name, size_str, "Pending"),
-                    tags=("checked",)
-                )
-
-                # Store file info
-                self.files[file_path] = {
-                    "item_id": item_id,
-                    "checked": True,
-                    "status": "Pending",
-                    "path": file_path,
-                    "filename": path.name,
-                    "size": size_str
-                }
+        # New paths in order, each once
+        new_paths = [
+            file_path for file_path in dict.fromkeys(file_paths)
+            if file_path not in self._index
+        ]
 
+        # Append the rows one column at a time (rendered when visible). The
+        # size stays None until the row is shown or prefetched.
+        count = len(new_paths)
+        self._index.update(zip(new_paths, range(len(self._paths), len(self._paths) + count)))
+        self._paths.extend(new_paths)
+        self._filenames.extend(map(os.path.basename, new_paths))
+        self._sizes.extend([None] * count)
+        self._status.extend([STATUS_PENDING] * count)
+        self._tags.extend([_TAGS_CHECKED] * count)
+        self._checked.extend(b"\x01" * count)
+
+        self._render_window()
         self._update_count()
         self._notify_selection_change()
 
     def remove_selected(self):
         """Remove selected files from the list."""
-        selected_items = self.tree.selection()
+        # Selection is tracked by path, so rows scrolled out of view count too
+        if self._selected_paths:
+            # Rows before the first removed one keep their index
+            start = min(self._index[path] for path in self._selected_paths)
+            for file_path in self._selected_paths:
+                del self._index[file_path]
 
-        # Find and remove corresponding files
-        files_to_remove = []
-        for file_path, info in self.files.items():
-            if info["item_id"] in selected_items:
-                files_to_remove.append(file_path)
+            kept = [row for row in range(start, len(self._paths)) if self._paths[row] in self._index]
+            for column in (self._paths, self._filenames, self._sizes, self._status, self._tags):
+                column[start:] = [column[row] for row in kept]
+            self._checked[start:] = bytes(self._checked[row] for row in kept)
 
-        for file_path in files_to_remove:
-            item_id = self.files[file_path]["item_id"]
-            self.tree.delete(item_id)
-            del self.files[file_path]
+            for row in range(start, len(self._paths)):
+                self._index[self._paths[row]] = row
+
+            self._selected_paths.clear()
+            self._render_window()
 
         self._update_count()
         self._notify_selection_change()
 
     def clear(self):
         """Clear all files from the list."""
-        self.tree.delete(*self.tree.get_children())
-        self.files.clear()
+        for column in (self._paths, self._filenames, self._sizes, self._status, self._tags):
+            column.clear()
+        self._checked.clear()
+        self._index.clear()
+        self._selected_paths.clear()
+        self._first_visible = 0
+        self._render_window()
         self._update_count()
         self._notify_selection_change()
 
     def select_all(self):
         """Check all files."""
-        for file_path, info in self.files.items():
-            if not info["checked"]:
-                info["checked"] = True
-                self.tree.item(info["item_id"], text="☑", tags=("checked",))
-
+        # bytearray.find jumps straight to each row whose tags change
+        row = self._checked.find(0)
+        while row != -1:
+            self._tags[row] = _TAGS_CHECKED
+            row = self._checked.find(0, row + 1)
+        self._checked[:] = b"\x01" * len(self._checked)
+
+        # Only the visible rows touch the tree
+        self._render_window()
+        self._update_count()
         self._notify_selection_change()
 
     def deselect_all(self):
         """Uncheck all files."""
-        for file_path, info in self.files.items():
-            if info["checked"]:
-                info["checked"] = False
-                self.tree.item(info["item_id"], text="☐", tags=("unchecked",))
+        row = self._checked.find(1)
+        while row != -1:
+            self._tags[row] = _TAGS_UNCHECKED
+            row = self._checked.find(1, row + 1)
+        self._checked[:] = bytes(len(self._checked))
 
+        self._render_window()
+        self._update_count()
         self._notify_selection_change()
 
     def get_selected_files(self) -> List[str]:
@@ -207,11 +280,16 @@ class FileListWidget(ttk.Frame):
         Returns:
             List of file paths that are checked
         """
-        return [
-            file_path
-            for file_path, info in self.files.items()
-            if info["checked"]
-        ]
+        return list(compress(self._paths, self._checked))
+
+    def get_selected_count(self) -> int:
+        """
+        Get the number of checked files, without building the path list.
+
+        Returns:
+            Number of checked files
+        """
+        return len(self._checked) - self._checked.count(0)
 
     def update_file_status(self, file_path: str, status: str):
         """
@@ -221,25 +299,17 @@ class FileListWidget(ttk.Frame):
             file_path: Path to the file
             status: New status (Pending, Processing, Success, Error)
         """
-        if file_path in self.files:
-            info = self.files[file_path]
-            info["status"] = status
+        row = self._index.get(file_path)
+        if row is not None:
+            self._status[row] = status
 
             # Determine tag based on status
-            if status == "Success":
-                tags = ("checked", "success")
-            elif status == "Error":
-                tags = ("checked", "error")
-            elif status == "Processing":
-                tags = ("checked", "processing")
-            else:
-                tags = ("checked",)
+            self._tags[row] = _STATUS_TAGS.get(status, _TAGS_CHECKED)
 
-            self.tree.item(
-                info["item_id"],
-                values=(info["filename"], info["size"], status),
-                tags=tags
-            )
+            # Only a visible row needs redrawing
+            slot = row - self._first_visible
+            if 0 <= slot < self._attached_rows:
+                self._render_row(slot)
 
     def _on_click(self, event):
         """Handle click events on the tree."""
@@ -249,22 +319,203 @@ class FileListWidget(ttk.Frame):
             # Click on checkbox column
             item = self.tree.identify_row(event.y)
             if item:
-                # Find the file
-                for file_path, info in self.files.items():
-                    if info["item_id"] == item:
-                        # Toggle checkbox
-                        info["checked"] = not info["checked"]
-                        checkbox = "☑" if info["checked"] else "☐"
-                        tags = ("checked",) if info["checked"] else ("unchecked",)
-                        self.tree.item(item, text=checkbox, tags=tags)
-                        self._notify_selection_change()
-                        break
+                # Find the file shown in this row
+                slot = self._row_slots[item]
+                row = self._first_visible + slot
+
+                # Toggle checkbox
+                self._checked[row] ^= 1
+                self._tags[row] = _TAGS_CHECKED if self._checked[row] else _TAGS_UNCHECKED
+                self._render_row(slot)
+                self._notify_selection_change()
 
     def _on_double_click(self, event):
         """Handle double-click events."""
         # Could be used to preview file or show details
         pass
 
+    def _on_tree_select(self, event):
+        """Record which files are highlighted in the visible rows."""
+        selected_items = set(self.tree.selection())
+        for slot in range(self._attached_rows):
+            file_path = self._paths[self._first_visible + slot]
+            if self._row_ids[slot] in selected_items:
+                self._selected_paths.add(file_path)
+            else:
+                self._selected_paths.discard(file_path)
+
+    def _on_tree_resize(self, event):
+        """Fit the number of rendered rows to the tree height."""
+        # One row's worth of height is taken by the headings
+        rows = max(1, event.height // self.ROW_HEIGHT - 1)
+        rows = min(rows, self.ROW_POOL_SIZE)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._render_window()
+
+    def _on_scroll(self, *args):
+        """
+        Handle scrollbar commands by moving the visible window.
+
+        Args:
+            args: Scrollbar command ("moveto", fraction) or
+                  ("scroll", count, "units"/"pages")
+        """
+        if not args:
+            return
+
+        if args[0] == "moveto":
+            self._first_visible = int(float(args[1]) * len(self._paths))
+            self._render_window()
+        elif args[0] == "scroll":
+            count = int(args[1])
+            if args[2] == "pages":
+                count *= self._visible_rows
+            self._scroll_rows(count)
+
+    def _on_mousewheel(self, event):
+        """Scroll the visible window with the mouse wheel."""
+        self._scroll_rows(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _scroll_rows(self, count: int):
+        """
+        Move the visible window by a number of rows.
+
+        Args:
+            count: Rows to scroll (negative scrolls up)
+        """
+        self._first_visible += count
+        self._render_window()
+
+    def prefetch_sizes(self, file_paths: List[str]):
+        """
+        Start background size lookups for files whose size is not known yet.
+
+        Sizes are otherwise only looked up when a file's row is shown.
+
+        Args:
+            file_paths: Paths of listed files
+        """
+        for file_path in file_paths:
+            row = self._index.get(file_path)
+            if row is not None and self._sizes[row] is None:
+                self._sizes[row] = "…"
+                future = _STAT_POOL.submit(os.stat, file_path)
+                future.add_done_callback(
+                    lambda done, file_path=file_path: self._on_stat_done(file_path, done)
+                )
+
+    def _on_stat_done(self, file_path: str, future: Future):
+        """
+        Hand a finished stat back to the Tk thread (runs in a pool thread).
+
+        Args:
+            file_path: Path that was stat'ed
+            future: Completed stat future
+        """
+        try:
+            self.after(0, self._apply_stat, file_path, future)
+        except (RuntimeError, tk.TclError):
+            # Widget destroyed or main loop gone; nothing to update
+            pass
+
+    def _apply_stat(self, file_path: str, future: Future):
+        """
+        Show the size from a completed stat in the file's row.
+
+        Args:
+            file_path: Path that was stat'ed
+            future: Completed stat future
+        """
+        row = self._index.get(file_path)
+        if row is None:
+            # Removed while the stat was pending
+            return
+
+        try:
+            self._sizes[row] = self._format_size(future.result().st_size)
+        except Exception:
+            self._sizes[row] = "Unknown"
+
+        slot = row - self._first_visible
+        if 0 <= slot < self._attached_rows:
+            self._render_row(slot)
+
+    def _render_window(self):
+        """Fill the pooled tree rows with the files in the visible window."""
+        total = len(self._paths)
+        max_first = max(0, total - self._visible_rows)
+        self._first_visible = min(max(self._first_visible, 0), max_first)
+        shown = min(self._visible_rows, total - self._first_visible)
+
+        # Attach or detach pooled rows to match the number shown
+        for slot in range(self._attached_rows, shown):
+            self.tree.move(self._row_ids[slot], "", slot)
+        if shown < self._attached_rows:
+            self.tree.detach(*self._row_ids[shown:self._attached_rows])
+        self._attached_rows = shown
+
+        visible_paths = self._paths[self._first_visible:self._first_visible + shown]
+        self.prefetch_sizes(visible_paths)
+
+        for slot in range(shown):
+            self._render_row(slot)
+
+        # Restore the highlight of selected files now in view
+        self.tree.selection_set([
+            self._row_ids[slot]
+            for slot in range(shown)
+            if self._paths[self._first_visible + slot] in self._selected_paths
+        ])
+
+        if total:
+            self.vsb.set(self._first_visible / total, (self._first_visible + shown) / total)
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _render_row(self, slot: int):
+        """
+        Show a file's current info in a pooled tree row.
+
+        Args:
+            slot: Index of the row within the visible window
+        """
+        index = self._first_visible + slot
+        row = (
+            _CHECKBOX_ON if self._checked[index] else _CHECKBOX_OFF,
+            (self._filenames[index], self._sizes[index], self._status[index]),
+            self._tags[index]
+        )
+
+        # Skip the Tcl call when the row already shows this content
+        previous = self._rendered_rows[slot]
+        if row == previous:
+            return
+        self._rendered_rows[slot] = row
+        item_id = self._row_ids[slot]
+
+        changed_columns = [] if previous is None else [
+            (column, value)
+            for column, value, old_value in zip(_COLUMNS, row[1], previous[1])
+            if value != old_value
+        ]
+        if previous is None or len(changed_columns) > 1:
+            # New file in this row: send everything at once
+            self.tree.item(item_id, text=row[0], values=row[1], tags=row[2])
+            return
+
+        # Same file with a size or status change: send only what changed
+        for column, value in changed_columns:
+            self.tree.set(item_id, column, value)
+        changes = {}
+        if row[0] != previous[0]:
+            changes["text"] = row[0]
+        if row[2] != previous[2]:
+            changes["tags"] = row[2]
+        if changes:
+            self.tree.item(item_id, **changes)
+
     def _format_size(self, size: int) -> str:
         """
         Format file size in human-readable format.
@@ -275,16 +526,23 @@ class FileListWidget(ttk.Frame):
         Returns:
             Formatted size string
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        # Unrolled unit checks (the shifts are folded to constants at
+        # compile time); dividing by a power of two is exact, so one
+        # division matches repeated division by 1024
+        if size < 1 << 10:
+            return f"{size:.1f} B"
+        if size < 1 << 20:
+            return f"{size / (1 << 10):.1f} KB"
+        if size < 1 << 30:
+            return f"{size / (1 << 20):.1f} MB"
+        if size < 1 << 40:
+            return f"{size / (1 << 30):.1f} GB"
+        return f"{size / (1 << 40):.1f} TB"
 
     def _update_count(self):
         """Update the file count label."""
-        total = len(self.files)
-        selected = sum(1 for info in self.files.values() if info["checked"])
+        total = len(self._paths)
+        selected = self.get_selected_count()
         self.count_label.config(text=f"Files: {selected}/{total}")
 
     def _notify_selection_change(self):
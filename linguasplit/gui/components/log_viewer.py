@@ -5,7 +5,11 @@ Log viewer widget for displaying real-time processing logs.
 import tkinter as tk
 from tkinter import ttk
 from tkinter import scrolledtext
-from typing import Optional
+from collections import deque
+from itertools import chain, islice
+from typing import List, Optional, Tuple
+import threading
+import time
 from datetime import datetime
 
 
@@ -30,6 +34,12 @@ class LogViewerWidget(ttk.Frame):
         'DEBUG': 'gray'
     }
 
+    # Delay before buffered messages are written to the text widget
+    FLUSH_DELAY_MS = 50
+
+    # Number of most recent messages kept (older ones are dropped)
+    MAX_LOG_ENTRIES = 50_000
+
     def __init__(self, parent, height: int = 10):
         """
         Initialize log viewer widget.
@@ -41,6 +51,17 @@ class LogViewerWidget(ttk.Frame):
         super().__init__(parent)
 
         self.height = height
+
+        # Messages waiting for the next flush, as (text, level) pairs
+        self._log_buffer: List[Tuple[str, str]] = []
+        self._flush_job: Optional[str] = None
+
+        # Formatted messages currently shown, oldest first
+        self._history = deque(maxlen=self.MAX_LOG_ENTRIES)
+
+        # (epoch second, "HH:MM:SS") of the last message's timestamp
+        self._timestamp: Optional[Tuple[int, str]] = None
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -100,18 +121,63 @@ class LogViewerWidget(ttk.Frame):
             level: Log level (INFO, WARNING, ERROR, SUCCESS, DEBUG)
         """
         # Add timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] [{level}] {message}\n"
+        formatted_message = f"[{self._current_timestamp()}] [{level}] {message}\n"
+
+        # Buffer the message; bursts are written to the widget together
+        self._log_buffer.append((formatted_message, level))
+        if self._flush_job is None:
+            self._flush_job = self.after(self.FLUSH_DELAY_MS, self._flush_logs)
+
+    def _flush_logs(self):
+        """Write buffered messages to the text widget in one update."""
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+
+        if not self._log_buffer:
+            return
+
+        messages = [message for message, _ in self._log_buffer]
+
+        # Text.insert takes alternating text and tag arguments, so the
+        # whole batch goes to Tk in a single call
+        segments = [part for entry in self._log_buffer for part in entry]
+        self._log_buffer = []
+
+        # Text lines of the oldest messages the history is about to drop
+        overflow = len(self._history) + len(messages) - self.MAX_LOG_ENTRIES
+        dropped_lines = 0
+        if overflow > 0:
+            oldest = islice(chain(self._history, messages), overflow)
+            dropped_lines = sum(message.count('\n') for message in oldest)
+        self._history.extend(messages)
 
-        # Insert into text widget
         self.text.config(state=tk.NORMAL)
-        self.text.insert(tk.END, formatted_message, level)
+        self.text.insert(tk.END, *segments)
+        if dropped_lines:
+            self.text.delete(1.0, f"{dropped_lines + 1}.0")
         self.text.config(state=tk.DISABLED)
 
         # Auto-scroll to bottom if enabled
         if self.auto_scroll_var.get():
             self.text.see(tk.END)
 
+    def _current_timestamp(self) -> str:
+        """
+        Get the current local time as HH:MM:SS.
+
+        The string is reused for messages logged within the same second.
+
+        Returns:
+            Formatted time of day
+        """
+        second = int(time.time())
+        timestamp = self._timestamp
+        if timestamp is None or timestamp[0] != second:
+            timestamp = (second, datetime.fromtimestamp(second).strftime("%H:%M:%S"))
+            self._timestamp = timestamp
+        return timestamp[1]
+
     def info(self, message: str):
         """Log info message."""
         self.log(message, 'INFO')
@@ -134,6 +200,8 @@ class LogViewerWidget(ttk.Frame):
 
     def clear(self):
         """Clear all log messages."""
+        self._log_buffer.clear()
+        self._history.clear()
         self.text.config(state=tk.NORMAL)
         self.text.delete(1.0, tk.END)
         self.text.config(state=tk.DISABLED)
@@ -148,13 +216,33 @@ class LogViewerWidget(ttk.Frame):
         )
 
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    content = self.text.get(1.0, tk.END)
-                    f.write(content)
-                self.success(f"Logs exported to: {file_path}")
-            except Exception as e:
-                self.error(f"Failed to export logs: {str(e)}")
+            # Snapshot the history and write it off the Tk thread
+            self._flush_logs()
+            threading.Thread(
+                target=self._write_logs,
+                args=(file_path, list(self._history)),
+                daemon=True
+            ).start()
+
+    def _write_logs(self, file_path: str, messages: List[str]):
+        """
+        Write log messages to a file (runs in a background thread).
+
+        The outcome is logged back on the Tk thread.
+
+        Args:
+            file_path: Destination file
+            messages: Formatted messages to write
+        """
+        try:
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                # Written from the history, plus the final newline the
+                # text widget's content always ends with
+                f.writelines(messages)
+                f.write('\n')
+            self.after(0, self.success, f"Logs exported to: {file_path}")
+        except Exception as e:
+            self.after(0, self.error, f"Failed to export logs: {str(e)}")
 
     def get_logs(self) -> str:
         """
@@ -163,4 +251,12 @@ class LogViewerWidget(ttk.Frame):
         Returns:
             Log content as string
         """
-        return self.text.get(1.0, tk.END)
+        self._flush_logs()
+        return ''.join(self._history) + '\n'
+
+    def destroy(self):
+        """Cancel any pending flush before destroying the widget."""
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        super().destroy()
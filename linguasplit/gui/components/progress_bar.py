@@ -2,9 +2,10 @@
 Progress bar widget with percentage and status text.
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class ProgressBarWidget(ttk.Frame):
@@ -18,6 +19,12 @@ class ProgressBarWidget(ttk.Frame):
     - Cancel button support
     """
 
+    # Minimum seconds between progress redraws; faster updates are coalesced
+    MIN_UPDATE_INTERVAL = 0.05
+
+    # Milliseconds between indeterminate animation steps
+    INDETERMINATE_INTERVAL_MS = 50
+
     def __init__(self, parent, on_cancel: Optional[callable] = None):
         """
         Initialize progress bar widget.
@@ -29,6 +36,17 @@ class ProgressBarWidget(ttk.Frame):
         super().__init__(parent)
 
         self.on_cancel = on_cancel
+
+        # Latest (percentage, status) not yet drawn, and when the last draw was
+        self._pending_progress: Optional[Tuple[Optional[float], str]] = None
+        self._update_job: Optional[str] = None
+        self._last_update = 0.0
+        self._percentage_text = "0%"
+
+        # Whether indeterminate mode is on (its animation only runs while shown)
+        self._indeterminate = False
+        self._visible = False
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -74,10 +92,17 @@ class ProgressBarWidget(ttk.Frame):
     def show(self):
         """Show the progress bar."""
         self.pack(fill=tk.X, padx=10, pady=5)
+        if self._indeterminate and not self._visible:
+            self.progress.start(self.INDETERMINATE_INTERVAL_MS)
+        self._visible = True
 
     def hide(self):
         """Hide the progress bar."""
         self.pack_forget()
+        if self._indeterminate and self._visible:
+            # No point animating a bar nobody can see
+            self.progress.stop()
+        self._visible = False
 
     def set_progress(self, current: int, total: int, status: str = ""):
         """
@@ -88,14 +113,63 @@ class ProgressBarWidget(ttk.Frame):
             total: Total value
             status: Status text to display
         """
-        if total > 0:
-            percentage = (current / total) * 100
+        percentage = (current / total) * 100 if total > 0 else None
+
+        # Merge with an update still waiting to be drawn
+        if self._pending_progress is not None:
+            pending_percentage, pending_status = self._pending_progress
+            if percentage is None:
+                percentage = pending_percentage
+            if not status:
+                status = pending_status
+        self._pending_progress = (percentage, status)
+
+        if self._update_job is not None:
+            return
+
+        # Draw now, or once the minimum interval has passed; the latest
+        # values are always drawn in the end
+        delay = self._last_update + self.MIN_UPDATE_INTERVAL - time.monotonic()
+        if delay <= 0:
+            self._draw_progress()
+        else:
+            self._update_job = self.after(int(delay * 1000) + 1, self._draw_progress)
+
+    def _draw_progress(self):
+        """Draw the latest pending progress update."""
+        self._update_job = None
+        if self._pending_progress is None:
+            return
+
+        percentage, status = self._pending_progress
+        self._pending_progress = None
+        self._last_update = time.monotonic()
+
+        if percentage is not None:
             self.progress['value'] = percentage
-            self.percentage_label.config(text=f"{percentage:.1f}%")
+            self._set_percentage_text(f"{percentage:.1f}%")
 
         if status:
             self.status_label.config(text=status)
 
+    def _cancel_pending_progress(self):
+        """Drop any progress update not drawn yet."""
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+            self._update_job = None
+        self._pending_progress = None
+
+    def _set_percentage_text(self, text: str):
+        """
+        Set the percentage label, skipping the Tk call if it is unchanged.
+
+        Args:
+            text: Percentage text
+        """
+        if text != self._percentage_text:
+            self._percentage_text = text
+            self.percentage_label.config(text=text)
+
     def set_indeterminate(self, active: bool = True):
         """
         Set indeterminate mode (for unknown duration tasks).
@@ -103,9 +177,11 @@ class ProgressBarWidget(ttk.Frame):
         Args:
             active: Whether to activate indeterminate mode
         """
+        self._indeterminate = active
         if active:
             self.progress['mode'] = 'indeterminate'
-            self.progress.start(10)
+            if self._visible:
+                self.progress.start(self.INDETERMINATE_INTERVAL_MS)
         else:
             self.progress.stop()
             self.progress['mode'] = 'determinate'
@@ -117,6 +193,9 @@ class ProgressBarWidget(ttk.Frame):
         Args:
             status: Status text
         """
+        # A newer status replaces one still waiting to be drawn
+        if self._pending_progress is not None:
+            self._pending_progress = (self._pending_progress[0], "")
         self.status_label.config(text=status)
 
     def show_cancel_button(self, show: bool = True):
@@ -133,17 +212,24 @@ class ProgressBarWidget(ttk.Frame):
 
     def reset(self):
         """Reset progress to 0."""
+        self._cancel_pending_progress()
         self.progress['value'] = 0
-        self.percentage_label.config(text="0%")
+        self._set_percentage_text("0%")
         self.status_label.config(text="Ready")
 
     def complete(self):
         """Set progress to 100% complete."""
+        self._cancel_pending_progress()
         self.progress['value'] = 100
-        self.percentage_label.config(text="100%")
+        self._set_percentage_text("100%")
         self.status_label.config(text="Complete")
 
     def _on_cancel_clicked(self):
         """Handle cancel button click."""
         if self.on_cancel:
             self.on_cancel()
+
+    def destroy(self):
+        """Cancel any pending redraw before destroying the widget."""
+        self._cancel_pending_progress()
+        super().destroy()
@@ -13,7 +13,7 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from linguasplit.gui.components.file_list import FileListWidget
+from linguasplit.gui.components.file_list import FileListWidget, STATUS_ERROR, STATUS_SUCCESS
 from linguasplit.gui.components.log_viewer import LogViewerWidget
 from linguasplit.gui.components.progress_bar import ProgressBarWidget
 from linguasplit.utils.config_manager import ConfigManager
@@ -50,6 +50,7 @@ class LinguaSplitMainWindow:
 
         # Load configuration
         self.config = ConfigManager()
+        self._cache_config_values()
 
         # Set window size from config
         window_size = self.config.get('gui.window_size', [1000, 700])
@@ -85,11 +86,18 @@ class LinguaSplitMainWindow:
         # Protocol handlers
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+    def _cache_config_values(self):
+        """Snapshot the config values read by the UI after startup."""
+        self._cfg_theme = self.config.get('gui.theme', 'system')
+        self._cfg_version = self.config.get('app.version', '1.0.0')
+        self._cfg_auto_save = self.config.get('gui.auto_save_settings', True)
+        self._cfg_create_summary = self.config.get('batch.create_summary', True)
+
     def _apply_theme(self):
         """Apply visual theme to the application."""
         try:
             from ttkthemes import ThemedStyle
-            theme_name = self.config.get('gui.theme', 'system')
+            theme_name = self._cfg_theme
 
             if theme_name == 'system':
                 # Use default ttk theme
@@ -344,10 +352,9 @@ class LinguaSplitMainWindow:
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=2)
 
         # Add version info
-        version = self.config.get('app.version', '1.0.0')
         ttk.Label(
             self.status_bar,
-            text=f"v{version}",
+            text=f"v{self._cfg_version}",
             anchor=tk.E
         ).pack(side=tk.RIGHT, padx=5, pady=2)
 
@@ -373,37 +380,44 @@ class LinguaSplitMainWindow:
             event: Drop event containing file paths
         """
         try:
-            # Get dropped files - format varies by platform
-            files = event.data
-
-            # Parse file paths (handle both single and multiple files)
-            if isinstance(files, str):
-                # macOS/Linux format: space-separated paths in curly braces
-                import re
-                # Remove curly braces and split by space (respecting quoted paths)
-                files = files.strip('{}').split('} {')
-                files = [f.strip('{}').strip() for f in files]
-
-            # Filter for PDF files only
-            pdf_files = []
-            for file_path in files:
-                path = Path(file_path)
-                if path.is_file() and path.suffix.lower() == '.pdf':
-                    pdf_files.append(str(path))
-                elif path.is_dir():
-                    # If a folder is dropped, add all PDFs from it
-                    folder_pdfs = list(path.glob("*.pdf"))
-                    pdf_files.extend([str(f) for f in folder_pdfs])
-
-            if pdf_files:
-                self.file_list.add_files(pdf_files)
-                self.log_viewer.info(f"Dropped {len(pdf_files)} PDF file(s)")
-            else:
-                self.log_viewer.warning("No PDF files found in dropped items")
+            # Dropped files arrive as a Tcl list; paths containing spaces
+            # are wrapped in braces, which the Tcl list parser handles
+            files = self.root.tk.splitlist(event.data)
+
+            # Filter for PDF files only, on a background thread so that
+            # scanning dropped folders does not block the UI
+            def collect_pdfs():
+                try:
+                    pdf_files = []
+                    for file_path in files:
+                        if file_path.lower().endswith('.pdf') and os.path.isfile(file_path):
+                            pdf_files.append(file_path)
+                        elif os.path.isdir(file_path):
+                            # If a folder is dropped, add all PDFs from it
+                            pdf_files.extend(self._scan_folder_pdfs(file_path))
+                except Exception as e:
+                    self.root.after(0, self.log_viewer.error, f"Error handling dropped files: {str(e)}")
+                    return
+                self.root.after(0, self._add_dropped_pdfs, pdf_files)
+
+            threading.Thread(target=collect_pdfs, daemon=True).start()
 
         except Exception as e:
             self.log_viewer.error(f"Error handling dropped files: {str(e)}")
 
+    def _add_dropped_pdfs(self, pdf_files: List[str]):
+        """
+        Add the PDF files collected from a drop (called from main thread).
+
+        Args:
+            pdf_files: PDF file paths
+        """
+        if pdf_files:
+            self.file_list.add_files(pdf_files)
+            self.log_viewer.info(f"Dropped {len(pdf_files)} PDF file(s)")
+        else:
+            self.log_viewer.warning("No PDF files found in dropped items")
+
     def _browse_input_folder(self):
         """Browse for input folder."""
         folder = filedialog.askdirectory(title="Select Input Folder")
@@ -439,16 +453,56 @@ class LinguaSplitMainWindow:
         """
         Load all PDF files from a folder.
 
+        The folder is scanned on a background thread and the files are
+        added on the main thread once the scan finishes.
+
         Args:
             folder: Folder path
         """
-        pdf_files = list(Path(folder).glob("*.pdf"))
+        def scan():
+            try:
+                pdf_files = self._scan_folder_pdfs(folder)
+            except OSError as e:
+                self.root.after(0, self.log_viewer.error, f"Could not read folder {folder}: {str(e)}")
+                return
+            self.root.after(0, self._add_folder_pdfs, folder, pdf_files)
+
+        threading.Thread(target=scan, daemon=True).start()
+
+    def _add_folder_pdfs(self, folder: str, pdf_files: List[str]):
+        """
+        Add the PDF files found in a folder (called from main thread).
+
+        Args:
+            folder: Folder path
+            pdf_files: PDF file paths found in the folder
+        """
         if pdf_files:
-            self.file_list.add_files([str(f) for f in pdf_files])
+            self.file_list.add_files(pdf_files)
             self.log_viewer.info(f"Added {len(pdf_files)} PDF file(s) from folder")
         else:
             messagebox.showwarning("No PDFs Found", f"No PDF files found in:\n{folder}")
 
+    @staticmethod
+    def _scan_folder_pdfs(folder: str) -> List[str]:
+        """
+        List the PDF files directly inside a folder.
+
+        Args:
+            folder: Folder path
+
+        Returns:
+            Paths of the PDF files, in directory order
+        """
+        # os.scandir reports entry types without a stat per file on most
+        # platforms, and only the folder itself is wrapped in a Path (so
+        # the joined paths match str(Path(folder) / name))
+        with os.scandir(str(Path(folder))) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            ]
+
     def _clear_files(self):
         """Clear all files from the list."""
         if messagebox.askyesno("Clear Files", "Remove all files from the list?"):
@@ -478,6 +532,7 @@ class LinguaSplitMainWindow:
         try:
             from linguasplit.gui.settings_dialog import SettingsDialog
             dialog = SettingsDialog(self.root, self.config)
+            self._cache_config_values()
 
             if dialog.result:
                 self.log_viewer.info("Settings updated successfully")
@@ -577,11 +632,11 @@ class LinguaSplitMainWindow:
                 file_path = result.get('pdf_path', '')
                 if result.get('success', False):
                     results['success'].append(file_path)
-                    self.root.after(0, self.file_list.update_file_status, file_path, "Success")
+                    self.root.after(0, self.file_list.update_file_status, file_path, STATUS_SUCCESS)
                     self.root.after(0, self.log_viewer.success, f"Completed: {Path(file_path).name}")
                 else:
                     results['failed'].append(file_path)
-                    self.root.after(0, self.file_list.update_file_status, file_path, "Error")
+                    self.root.after(0, self.file_list.update_file_status, file_path, STATUS_ERROR)
                     error_msg = result.get('error', 'Unknown error')
                     self.root.after(0, self.log_viewer.error, f"Failed: {Path(file_path).name} - {error_msg}")
 
@@ -614,7 +669,7 @@ class LinguaSplitMainWindow:
         self.log_viewer.info(f"Processing complete: {success_count}/{total} successful, {failed_count} failed")
 
         # Show summary dialog
-        if self.config.get('batch.create_summary', True):
+        if self._cfg_create_summary:
             try:
                 from linguasplit.gui.summary_dialog import SummaryDialog
                 SummaryDialog(self.root, results, self.output_folder.get())
@@ -692,7 +747,7 @@ class LinguaSplitMainWindow:
     
     def _update_ui_state(self):
         """Update UI state based on current selections."""
-        selected_count = len(self.file_list.get_selected_files())
+        selected_count = self.file_list.get_selected_count()
         
         # Build status message
         status_parts = [f"{selected_count} file(s) selected"]
@@ -711,10 +766,9 @@ class LinguaSplitMainWindow:
 
     def _show_about(self):
         """Show about dialog."""
-        version = self.config.get('app.version', '1.0.0')
         messagebox.showinfo(
             "About LinguaSplit",
-            f"LinguaSplit v{version}\n\n"
+            f"LinguaSplit v{self._cfg_version}\n\n"
             "Multi-Language PDF Document Extractor\n\n"
             "Intelligently extracts and separates multilingual content from PDF documents.\n\n"
             "Features:\n"
@@ -744,7 +798,7 @@ class LinguaSplitMainWindow:
                 return
 
         # Save window size if auto-save is enabled
-        if self.config.get('gui.auto_save_settings', True):
+        if self._cfg_auto_save:
             width = self.root.winfo_width()
             height = self.root.winfo_height()
             self.config.set('gui.window_size', [width, height])
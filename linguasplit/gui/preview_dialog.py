@@ -278,7 +278,10 @@ class PreviewDialog:
         try:
             from linguasplit.core.language_detector import LanguageDetector
 
-            detector = LanguageDetector()
+            # Only load the langdetect profiles for the configured languages
+            detector = LanguageDetector(restrict_to=list(self.config.get(
+                'language.target_languages', ['kinyarwanda', 'english', 'french']
+            ) or ()))
 
             # Simple split by newlines for demo
             # In real implementation, this would use proper text extraction
@@ -0,0 +1,93 @@
+"""
+Tests for the PDF processor.
+"""
+
+import types
+
+import pytest
+
+from linguasplit.core import pdf_processor
+from linguasplit.core.pdf_processor import (
+    _LANG_ANY_PATTERN,
+    _LANG_PATTERNS,
+    _LANG_TRIGGERS,
+    PDFProcessor,
+)
+from linguasplit.utils.config_manager import ConfigManager
+
+
+def _marker_samples():
+    """Yield (language, sample text) for every alternative of every marker pattern."""
+    for lang, patterns in _LANG_PATTERNS.items():
+        for pattern in patterns:
+            source = pattern.pattern
+            group = source[source.index('(') + 1:source.rindex(')')]
+            for alternative in group.split('|'):
+                sample = (
+                    alternative.replace("\\'", "'")
+                    .replace('\\s+', ' ')
+                    .replace('\\d+', '1')
+                )
+                yield lang, sample
+
+
+@pytest.mark.parametrize('lang,sample', list(_marker_samples()))
+def test_every_marker_alternative_contains_a_trigger(lang, sample):
+    line = f"x {sample} x"
+    assert _LANG_ANY_PATTERN[lang].search(line)
+    assert any(trigger in line for trigger in _LANG_TRIGGERS[lang])
+
+
+def test_french_commissaires_passes_trigger_filter():
+    line = "Les Commissaires réunis"
+    assert _LANG_ANY_PATTERN['french'].search(line)
+    assert any(trigger in line for trigger in _LANG_TRIGGERS['french'])
+
+
+class _FailingModel:
+    """fastText model stand-in whose predict fails like 0.9.2 under NumPy 2."""
+
+    def predict(self, lines, k=1):
+        raise ValueError("Unable to avoid copy while creating an array as requested.")
+
+
+@pytest.fixture
+def fake_fasttext(monkeypatch):
+    """Install a stub fasttext module that counts load_model calls."""
+    loads = []
+
+    def load_model(path):
+        loads.append(path)
+        return _FailingModel()
+
+    monkeypatch.setattr(pdf_processor, 'FASTTEXT_AVAILABLE', True)
+    monkeypatch.setattr(pdf_processor, 'fasttext', types.SimpleNamespace(load_model=load_model), raising=False)
+    monkeypatch.setattr(pdf_processor, '_fasttext_models', {})
+    return loads
+
+
+def _processor(tmp_path):
+    config = ConfigManager(str(tmp_path / 'config.json'))
+    config.set('language.fasttext_model', str(tmp_path / 'lid.176.ftz'), save=False)
+    return PDFProcessor(config=config)
+
+
+def test_fasttext_model_loaded_once_per_path(tmp_path, fake_fasttext):
+    first = _processor(tmp_path)
+    second = _processor(tmp_path)
+
+    assert len(fake_fasttext) == 1
+    assert first.fasttext_model is second.fasttext_model
+
+
+def test_fasttext_predict_failure_falls_back_to_language_detector(tmp_path, fake_fasttext, monkeypatch):
+    processor = _processor(tmp_path)
+    monkeypatch.setattr(
+        processor.language_detector, 'detect_batch',
+        lambda lines: [('french', 0.99)] * len(lines)
+    )
+
+    assert processor._detect_lines_uncached(['une ligne', 'une autre ligne']) == ['french', 'french']
+    assert processor.fasttext_model is None
+    assert _processor(tmp_path).fasttext_model is None
+    assert len(fake_fasttext) == 1
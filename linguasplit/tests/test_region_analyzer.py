@@ -0,0 +1,120 @@
+"""
+Tests for the region analyzer.
+"""
+
+from itertools import combinations
+
+import fitz  # PyMuPDF
+import numpy as np
+import pytest
+
+from linguasplit.core.region_analyzer import RegionAnalyzer, _kmeans_1d
+
+
+def _plain(value):
+    """Convert arrays (and containers of them) to comparable Python values."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+@pytest.fixture
+def two_column_pdf(tmp_path):
+    """A 5-page PDF with a full-width heading and two text columns per page."""
+    pdf_path = tmp_path / "two_column.pdf"
+    doc = fitz.open()
+    for page_num in range(5):
+        page = doc.new_page()
+        page.insert_text((72, 60), f"CHAPTER {page_num + 1}: General provisions", fontsize=14)
+        for row in range(12):
+            y = 110 + row * 40
+            page.insert_text((72, y), f"Article {row + 1}: the Commission shall act", fontsize=10)
+            page.insert_text((330, y), f"Article {row + 1} : la Commission agit", fontsize=10)
+    doc.save(str(pdf_path))
+    doc.close()
+    return str(pdf_path)
+
+
+def test_analyze_document_matches_analyze_page(two_column_pdf):
+    analyzer = RegionAnalyzer()
+
+    with fitz.open(two_column_pdf) as doc:
+        expected = [_plain(analyzer.analyze_page(page)) for page in doc]
+
+    serial = analyzer.analyze_document(two_column_pdf, workers=1)
+    parallel = analyzer.analyze_document(two_column_pdf, workers=2)
+
+    assert len(serial) == len(parallel) == len(expected) == 5
+    for page_num in range(5):
+        assert _plain(serial[page_num]) == expected[page_num]
+        assert _plain(parallel[page_num]) == expected[page_num]
+
+
+def _inertia(values, labels):
+    """Within-cluster sum of squares of a labelling."""
+    values = np.asarray(values, dtype=np.float64)
+    return sum(
+        float(((values[labels == label] - values[labels == label].mean()) ** 2).sum())
+        for label in np.unique(labels)
+    )
+
+
+def _brute_force_kmeans(values, k):
+    """Best split of the sorted distinct values into k contiguous clusters."""
+    values = np.asarray(values, dtype=np.float64)
+    uniq = np.unique(values)
+    best_labels, best_inertia = None, np.inf
+    for splits in combinations(range(1, len(uniq)), k - 1):
+        labels = np.searchsorted(np.array(splits), np.searchsorted(uniq, values), side='right')
+        inertia = _inertia(values, labels)
+        if inertia < best_inertia:
+            best_labels, best_inertia = labels, inertia
+    return best_labels, best_inertia
+
+
+@pytest.mark.parametrize('k', [2, 3])
+@pytest.mark.parametrize('seed', range(25))
+def test_kmeans_1d_matches_brute_force(k, seed):
+    rng = np.random.default_rng(seed)
+    # Column-like data: a few well separated groups plus noise, some repeats
+    values = np.concatenate([
+        rng.normal(loc, 15.0, size=rng.integers(2, 6))
+        for loc in rng.choice([100.0, 300.0, 450.0, 520.0], size=3, replace=False)
+    ])
+    values = np.concatenate([values, values[:2]])
+
+    labels, centers = _kmeans_1d(values, k)
+    expected_labels, expected_inertia = _brute_force_kmeans(values, k)
+
+    assert _inertia(values, labels) == pytest.approx(expected_inertia)
+    assert labels.tolist() == expected_labels.tolist()
+    for label in range(k):
+        assert centers[label] == pytest.approx(values[labels == label].mean())
+    assert np.all(np.diff(centers) > 0)
+
+
+@pytest.mark.parametrize('k', [2, 3])
+def test_kmeans_1d_all_values_equal(k):
+    labels, centers = _kmeans_1d([72.0] * 6, k)
+
+    assert labels.tolist() == [0] * 6
+    assert centers.tolist() == [72.0] * k
+
+
+@pytest.mark.parametrize('values,k,expected_labels', [
+    ([300.0, 80.0, 300.0, 80.0], 3, [1, 0, 1, 0]),
+    ([80.0, 300.0, 520.0], 3, [0, 1, 2]),
+    ([80.0, 80.0, 300.0], 2, [0, 0, 1]),
+])
+def test_kmeans_1d_no_more_distinct_values_than_clusters(values, k, expected_labels):
+    labels, centers = _kmeans_1d(values, k)
+
+    assert labels.tolist() == expected_labels
+    assert _inertia(values, labels) == 0.0
+    assert len(centers) == k
+    for label in set(expected_labels):
+        assert centers[label] == values[expected_labels.index(label)]
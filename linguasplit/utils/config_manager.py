@@ -35,6 +35,9 @@ class ConfigManager:
             'auto_detect': True,
             'default_language': 'english',
             'min_confidence': 0.5,
+            'fasttext_model': '',  # Optional path to fastText lid.176.ftz
+            # Languages statistical detection is limited to (empty for all)
+            'target_languages': ['kinyarwanda', 'english', 'french'],
         },
 
         # Layout detection
@@ -51,6 +54,7 @@ class ConfigManager:
             'remove_headers_footers': True,
             'normalize_whitespace': True,
             'fix_hyphenation': True,
+            'page_workers': 0,  # 0 = CPU count - 1, 1 = serial
         },
 
         # OCR settings
@@ -4,11 +4,18 @@ Handles file I/O, path operations, and file validation.
 """
 
 import os
+import json
 import shutil
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 import hashlib
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class FileHelper:
     """
@@ -27,6 +34,8 @@ class FileHelper:
         'json': ['.json'],
     }
 
+    WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for output files
+
     @staticmethod
     def is_supported_file(file_path: str, file_type: Optional[str] = None) -> bool:
         """
@@ -227,7 +236,8 @@ class FileHelper:
             path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write file
-            with open(file_path, 'w', encoding=encoding) as f:
+            with open(file_path, 'w', encoding=encoding,
+                      buffering=FileHelper.WRITE_BUFFER_SIZE) as f:
                 f.write(content)
 
             return True
@@ -236,6 +246,54 @@ class FileHelper:
             print(f"Error writing file {file_path}: {e}")
             return False
 
+    @staticmethod
+    def write_json_file(
+        file_path: str,
+        data: Any,
+        encoding: str = 'utf-8',
+        indent: int = 2
+    ) -> bool:
+        """
+        Serialize data as JSON straight into a file.
+
+        Uses orjson (C, emits UTF-8 bytes directly) when available for
+        2-space indentation; otherwise the document is encoded
+        incrementally into a buffered file with the json module.
+
+        Args:
+            file_path: Path to file
+            data: JSON-serializable object
+            encoding: File encoding
+            indent: Indentation level
+
+        Returns:
+            True if successful
+        """
+        try:
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+            if ORJSON_AVAILABLE and indent == 2 and encoding.lower().replace('-', '') == 'utf8':
+                try:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                except TypeError:
+                    # Not representable by orjson (e.g. lone surrogates)
+                    payload = None
+
+                if payload is not None:
+                    with open(file_path, 'wb') as f:
+                        f.write(payload)
+                    return True
+
+            with open(file_path, 'w', encoding=encoding,
+                      buffering=FileHelper.WRITE_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+
+            return True
+
+        except Exception as e:
+            print(f"Error writing file {file_path}: {e}")
+            return False
+
     @staticmethod
     def get_file_size(file_path: str) -> Optional[int]:
         """